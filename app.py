@@ -2,33 +2,46 @@
 from __future__ import annotations
 
 import base64
+import bisect
 import hashlib
-import json
+import itertools
 import os
+import random
+import sqlite3
+import threading
 import time as time_module
-from datetime import date, datetime, time, timedelta
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, time
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from functools import lru_cache, partial
 from typing import Any, Callable, Literal, Optional, cast
 
 import re
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import streamlit as st
 import streamlit.components.v1 as components
-from pydantic import ValidationError
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from pydantic import TypeAdapter, ValidationError
 
 ROOT = Path(__file__).resolve().parent
 
-from mikroabenteuer.config import AppConfig
+from mikroabenteuer.circuit_breaker import CircuitBreaker
+from mikroabenteuer.config import AppConfig, offline_config
 from mikroabenteuer.constants import (
+    DEFAULT_TIMEZONE,
+    EFFORT_INDEX,
+    EFFORT_LEVELS,
     Language,
     effort_label,
     theme_label,
     theme_options,
 )
 from mikroabenteuer.data_seed import seed_adventures
-from mikroabenteuer.email_templates import render_daily_email_html
 from mikroabenteuer.activity_library import suggest_activities_offline
 from mikroabenteuer.ics import build_ics_event
 from mikroabenteuer.materials import (
@@ -37,6 +50,7 @@ from mikroabenteuer.materials import (
 )
 from mikroabenteuer.models import (
     ActivitySearchCriteria,
+    ActivitySuggestion,
     DevelopmentDomain,
     TimeWindow,
     WeatherCondition as EventWeatherCondition,
@@ -49,6 +63,7 @@ from mikroabenteuer.openai_gen import (
     generate_activity_plan,
     render_activity_plan_markdown,
 )
+from mikroabenteuer import openai_activity_service
 from mikroabenteuer.openai_activity_service import (
     ERROR_CODE_API_NON_RETRYABLE,
     ERROR_CODE_MISSING_API_KEY,
@@ -60,8 +75,8 @@ from mikroabenteuer.plan_reports import (
     REPORT_REASONS,
     save_plan_report,
 )
+from mikroabenteuer.rate_limit import TokenBucket, credential_bucket_key
 from mikroabenteuer.recommender import pick_daily_adventure
-from mikroabenteuer.scheduler import run_daily_job_once
 from mikroabenteuer.settings import load_runtime_config, render_missing_config_ui
 from mikroabenteuer.weather import WeatherSummary, fetch_weather_for_day
 from mikroabenteuer.ui.filter_specs import (
@@ -70,7 +85,11 @@ from mikroabenteuer.ui.filter_specs import (
     render_filter_fields,
 )
 from mikroabenteuer.ui.sidebar_nav import page_label_daily, page_label_library
-from mikroabenteuer.ui.state_keys import CriteriaKeySpace, CriteriaNamespace
+from mikroabenteuer.ui.state_keys import (
+    CriteriaKeySpace,
+    CriteriaNamespace,
+    widget_key_pairs,
+)
 
 
 st.set_page_config(page_title="Mikroabenteuer des Tages", page_icon="🌿", layout="wide")
@@ -89,6 +108,19 @@ AGE_BAND_OPTIONS: tuple[tuple[str, float], ...] = (
     ("6-8", 7.0),
     ("9-12", 10.5),
 )
+AGE_BAND_LABELS: tuple[str, ...] = tuple(label for label, _ in AGE_BAND_OPTIONS)
+AGE_BAND_YEARS: dict[str, float] = dict(AGE_BAND_OPTIONS)
+# Boundaries halfway between neighbouring bands (options are sorted by age);
+# bisect_left keeps ties on the younger band, like the former min() scan.
+_AGE_BAND_BOUNDARIES: tuple[float, ...] = tuple(
+    (low + high) / 2 for (_, low), (_, high) in itertools.pairwise(AGE_BAND_OPTIONS)
+)
+LOCATION_OPTIONS: tuple[str, ...] = ("mixed", "outdoor", "indoor")
+EVENT_MODE_OPTIONS: tuple[str, ...] = ("schnell", "genau")
+_LOCATION_LABELS: dict[Language, dict[str, str]] = {
+    "DE": {"mixed": "Gemischt", "outdoor": "Draußen", "indoor": "Drinnen"},
+    "EN": {"mixed": "Mixed", "outdoor": "Outdoor", "indoor": "Indoor"},
+}
 
 DURATION_OPTIONS: tuple[int, ...] = (30, 45, 60, 90, 120, 180, 240, 300, 360)
 GOAL_OPTIONS: tuple[DevelopmentDomain, ...] = (
@@ -121,7 +153,7 @@ MATERIAL_OPTIONS: tuple[str, ...] = COMMON_HOUSEHOLD_MATERIALS
 
 CORE_FILTER_SPECS: tuple[FilterFieldSpec, ...] = build_core_filter_specs(
     duration_options=DURATION_OPTIONS,
-    effort_options=("niedrig", "mittel", "hoch"),
+    effort_options=EFFORT_LEVELS,
     goal_options=GOAL_OPTIONS,
     constraint_options=CONSTRAINT_OPTIONS,
     material_options=MATERIAL_OPTIONS,
@@ -134,13 +166,32 @@ def _core_specs_by_id(*ids: str) -> tuple[FilterFieldSpec, ...]:
     return tuple(spec for spec in CORE_FILTER_SPECS if spec.id in wanted)
 
 
+@lru_cache(maxsize=2)
+def _filter_formatters(lang: Language) -> dict[str, Callable[[Any], str]]:
+    # Shared read-only mapping per language per script run (the memo is rebuilt
+    # with the script module on rerun); render_filter_fields only reads it.
+    return {
+        "effort": partial(effort_label, lang=lang),
+        "topics": partial(theme_label, lang=lang),
+        "goals": DOMAIN_LABELS.__getitem__,
+        "available_materials": _material_label,
+    }
+
+
+def _nearest_age_band_index(age_years: float) -> int:
+    return bisect.bisect_left(_AGE_BAND_BOUNDARIES, age_years)
+
+
 def _material_label(material_key: str) -> str:
     return MATERIAL_LABELS.get(material_key, material_key)
 
 
+_SANITIZE_DROP_RE = re.compile(r"[^\w\s,\-äöüÄÖÜß]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _sanitize_optional_text(value: str, *, max_chars: int = 80) -> str:
-    cleaned = re.sub(r"[^\w\s,\-äöüÄÖÜß]", "", (value or "").strip())
-    cleaned = " ".join(cleaned.split())
+    cleaned = _WHITESPACE_RE.sub(" ", _SANITIZE_DROP_RE.sub("", value or "")).strip()
     return cleaned[:max_chars].rstrip()
 
 
@@ -151,11 +202,58 @@ def _optional_csv_items(value: str, *, max_items: int = 2) -> list[str]:
     return [part.strip() for part in normalized.split(",") if part.strip()][:max_items]
 
 
+# "Miriam" must precede "Miri" so the longer name wins in the alternation.
+_FAMILY_TOKEN_RE = re.compile(r"Carla|Miriam|Miri|2,5")
+
+
+def _family_token_replacer(profile: FamilyProfile) -> Callable[[re.Match[str]], str]:
+    # No profile is a no-op rewrite ("Miri" and "Miriam" both map to the parent
+    # names), so there is no default-profile shortcut. Callers rewriting many
+    # texts build the replacer once and reuse it for every field.
+    replacements = {
+        "Carla": profile.child_name,
+        "Miriam": profile.parent_names,
+        "Miri": profile.parent_names,
+        "2,5": f"{profile.child_age_years:.1f}".replace(".", ","),
+    }
+    return lambda match: replacements[match.group(0)]
+
+
 def _replace_family_tokens(text: str, profile: FamilyProfile) -> str:
-    sanitized = text.replace("Carla", profile.child_name)
-    sanitized = sanitized.replace("Miriam", profile.parent_names)
-    sanitized = sanitized.replace("Miri", profile.parent_names)
-    return sanitized.replace("2,5", f"{profile.child_age_years:.1f}".replace(".", ","))
+    return _FAMILY_TOKEN_RE.sub(_family_token_replacer(profile), text)
+
+
+def _family_token_rewriter(profile: FamilyProfile) -> Callable[[str], str]:
+    return partial(_FAMILY_TOKEN_RE.sub, _family_token_replacer(profile))
+
+
+# ASCII unit separator: never part of a family token, so a joined corpus can
+# be rewritten in one pass and split back into the original fields.
+_TOKEN_FIELD_SEPARATOR = "\x1f"
+_PLAN_TOKEN_LIST_FIELDS = ("steps", "safety_notes", "parent_child_prompts", "variants")
+
+
+def _replace_family_tokens_batch(
+    texts: Sequence[str], profile: FamilyProfile
+) -> list[str]:
+    rewrite = _family_token_rewriter(profile)
+    corpus = _TOKEN_FIELD_SEPARATOR.join(texts)
+    if corpus.count(_TOKEN_FIELD_SEPARATOR) != max(len(texts) - 1, 0):
+        return [rewrite(text) for text in texts]
+    return rewrite(corpus).split(_TOKEN_FIELD_SEPARATOR)
+
+
+def _profiled_activity_plan(plan: ActivityPlan, profile: FamilyProfile) -> ActivityPlan:
+    list_fields = [getattr(plan, field) for field in _PLAN_TOKEN_LIST_FIELDS]
+    texts = [plan.title, plan.summary, *itertools.chain.from_iterable(list_fields)]
+    # Most generated plans never mention the seed names; skip the copy then.
+    if not any(_FAMILY_TOKEN_RE.search(text) for text in texts):
+        return plan
+    replaced = iter(_replace_family_tokens_batch(texts, profile))
+    update: dict[str, Any] = {"title": next(replaced), "summary": next(replaced)}
+    for field, values in zip(_PLAN_TOKEN_LIST_FIELDS, list_fields, strict=True):
+        update[field] = list(itertools.islice(replaced, len(values)))
+    return plan.model_copy(update=update)
 
 
 def _profile_name_or_fallback(name: str, *, fallback: str) -> str:
@@ -174,39 +272,26 @@ def _build_profile_title(profile: FamilyProfile) -> str:
 def _profiled_adventure(
     adventure: MicroAdventure, profile: FamilyProfile
 ) -> MicroAdventure:
+    rewrite = _family_token_rewriter(profile)
     return MicroAdventure(
         slug=adventure.slug,
-        title=_replace_family_tokens(adventure.title, profile),
+        title=rewrite(adventure.title),
         area=adventure.area,
-        short=_replace_family_tokens(adventure.short, profile),
+        short=rewrite(adventure.short),
         duration_minutes=adventure.duration_minutes,
         distance_km=adventure.distance_km,
         best_time=adventure.best_time,
         stroller_ok=adventure.stroller_ok,
-        start_point=_replace_family_tokens(adventure.start_point, profile),
-        route_steps=[
-            _replace_family_tokens(step, profile) for step in adventure.route_steps
-        ],
-        preparation=[
-            _replace_family_tokens(item, profile) for item in adventure.preparation
-        ],
-        packing_list=[
-            _replace_family_tokens(item, profile) for item in adventure.packing_list
-        ],
-        execution_tips=[
-            _replace_family_tokens(item, profile) for item in adventure.execution_tips
-        ],
-        variations=[
-            _replace_family_tokens(item, profile) for item in adventure.variations
-        ],
-        toddler_benefits=[
-            _replace_family_tokens(item, profile) for item in adventure.toddler_benefits
-        ],
-        carla_tip=_replace_family_tokens(adventure.carla_tip, profile),
-        risks=[_replace_family_tokens(item, profile) for item in adventure.risks],
-        mitigations=[
-            _replace_family_tokens(item, profile) for item in adventure.mitigations
-        ],
+        start_point=rewrite(adventure.start_point),
+        route_steps=[rewrite(step) for step in adventure.route_steps],
+        preparation=[rewrite(item) for item in adventure.preparation],
+        packing_list=[rewrite(item) for item in adventure.packing_list],
+        execution_tips=[rewrite(item) for item in adventure.execution_tips],
+        variations=[rewrite(item) for item in adventure.variations],
+        toddler_benefits=[rewrite(item) for item in adventure.toddler_benefits],
+        carla_tip=rewrite(adventure.carla_tip),
+        risks=[rewrite(item) for item in adventure.risks],
+        mitigations=[rewrite(item) for item in adventure.mitigations],
         tags=list(adventure.tags),
         accessibility=list(adventure.accessibility),
         season_tags=list(adventure.season_tags),
@@ -231,6 +316,36 @@ def _truncate_text_with_limit(text: str, *, max_chars: int) -> tuple[str, bool]:
     return text[:max_chars], True
 
 
+@st.cache_resource(show_spinner=False)
+def _shared_request_bucket(
+    path: str, capacity: int, refill_per_hour: float
+) -> TokenBucket:
+    return TokenBucket(
+        Path(path), capacity=capacity, refill_per_s=refill_per_hour / 3600
+    )
+
+
+def _consume_shared_budget(cfg: AppConfig) -> bool:
+    """Draw from the deployment-wide budget when SHARED_BUDGET_PATH is set.
+
+    All sessions using the same API key share one bucket of
+    ``shared_budget_capacity`` requests, independent of the per-session limit.
+    """
+    if not cfg.shared_budget_path:
+        return True
+    bucket = _shared_request_bucket(
+        cfg.shared_budget_path,
+        cfg.shared_budget_capacity,
+        cfg.shared_budget_refill_per_hour,
+    )
+    try:
+        return bucket.try_consume(credential_bucket_key(cfg.openai_api_key))
+    except (sqlite3.Error, OSError):
+        # Unwritable/locked store (or its directory cannot be created): the
+        # per-session counter still applies.
+        return True
+
+
 def _consume_request_budget(cfg: AppConfig, *, lang: Language, scope: str) -> bool:
     count = int(st.session_state.get("request_count", 0))
     if count >= cfg.max_requests_per_session:
@@ -242,6 +357,15 @@ def _consume_request_budget(cfg: AppConfig, *, lang: Language, scope: str) -> bo
             )
         )
         return False
+    if not _consume_shared_budget(cfg):
+        st.warning(
+            _t(
+                lang,
+                "Gemeinsames Anfragebudget ist aufgebraucht. Bitte später erneut versuchen.",
+                "Shared request budget is used up. Please try again later.",
+            )
+        )
+        return False
 
     st.session_state["request_count"] = count + 1
     current = int(st.session_state["request_count"])
@@ -255,9 +379,19 @@ def _consume_request_budget(cfg: AppConfig, *, lang: Language, scope: str) -> bo
     return True
 
 
-@st.cache_data(show_spinner=False)
-def _read_background_b64(background_path: str) -> str:
-    return base64.b64encode(Path(background_path).read_bytes()).decode("utf-8")
+@st.cache_resource(show_spinner=False)
+def _get_http_session() -> requests.Session:
+    """Process-wide HTTP session so Open-Meteo/zippopotam calls reuse TLS."""
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
 
 
 @st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
@@ -268,7 +402,7 @@ def _resolve_location_from_plz(
 ) -> dict[str, str] | None:
     """Resolve a German postal code to coarse user-location metadata."""
     try:
-        response = requests.get(
+        response = _get_http_session().get(
             f"https://api.zippopotam.us/de/{plz}",
             timeout=timeout_s,
         )
@@ -296,13 +430,18 @@ def _resolve_location_from_plz(
     }
 
 
-def inject_custom_styles(background_path: Path) -> None:
-    if not background_path.exists():
-        return
+STATIC_DIR = ROOT / "static"
 
-    background_b64 = _read_background_b64(str(background_path))
-    st.markdown(
-        f"""
+
+@st.cache_resource(show_spinner=False)
+def _build_background_css(background_url: str) -> str:
+    """Build the full ``<style>`` block once per process.
+
+    The background is served by Streamlit's static file server, so the CSS
+    only carries its URL and the browser caches the image itself. Whitespace
+    is collapsed because the block is re-sent on every rerun.
+    """
+    css = f"""
         <style>
             :root {{
                 --primary-dark-green: #00715D;
@@ -325,7 +464,7 @@ def inject_custom_styles(background_path: Path) -> None:
                 background: linear-gradient(
                     rgba(249, 244, 231, 0.92),
                     rgba(249, 244, 231, 0.92)
-                ), url("data:image/png;base64,{background_b64}");
+                ), url("{background_url}");
                 background-size: cover;
                 background-position: center;
                 background-attachment: fixed;
@@ -474,35 +613,169 @@ def inject_custom_styles(background_path: Path) -> None:
                 color: #1f2933 !important;
             }}
         </style>
-        """,
-        unsafe_allow_html=True,
+        """
+    return _WHITESPACE_RE.sub(" ", css).strip()
+
+
+def inject_custom_styles(background_path: Path) -> None:
+    # One stat() per rerun covers both the existence check and the mtime.
+    try:
+        mtime = int(background_path.stat().st_mtime)
+    except OSError:
+        return
+
+    # The mtime query string busts the browser cache when the image changes.
+    background_url = f"./app/static/{background_path.name}?v={mtime}"
+    css = _build_background_css(background_url)
+    st.markdown(css, unsafe_allow_html=True)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_adventures() -> tuple[MicroAdventure, ...]:
+    # Shared, read-only seed data: a resource cache survives reruns (the script
+    # module does not) and hands out the same tuple without a pickle
+    # round-trip. Callers must not mutate items.
+    return tuple(seed_adventures())
+
+
+@st.cache_resource(show_spinner=False)
+def _adventures_by_slug() -> dict[str, MicroAdventure]:
+    return {adventure.slug: adventure for adventure in _load_adventures()}
+
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def _profiled_adventure_cached(slug: str, profile: FamilyProfile) -> MicroAdventure:
+    # FamilyProfile is frozen, so (slug, profile) fully keys the result.
+    return _profiled_adventure(_adventures_by_slug()[slug], profile)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _daily_pick_slug(
+    _adventures: Sequence[MicroAdventure],
+    _criteria: ActivitySearchCriteria,
+    _weather: Optional[WeatherSummary],
+    *,
+    cache_key: str,
+) -> str:
+    # Underscored args are skipped by Streamlit's hasher; the adventures are
+    # the static seed data, so ``cache_key`` (criteria + weather) fully keys
+    # the pick. Returning the slug keeps pickled cache entries tiny.
+    picked, _candidates = pick_daily_adventure(_adventures, _criteria, _weather)
+    return picked.slug
+
+
+def _daily_pick_cache_key(
+    criteria: ActivitySearchCriteria, weather: Optional[WeatherSummary]
+) -> str:
+    weather_json = orjson.dumps(asdict(weather)).decode() if weather else ""
+    return f"{criteria.model_dump_json()}|{weather_json}"
+
+
+WEATHER_FAILURE_TTL_S = 60.0
+
+
+class _WeatherUnavailable(Exception):
+    """Raised inside the cached fetchers so a fallback summary is not cached."""
+
+    def __init__(self, fallback: WeatherSummary) -> None:
+        super().__init__(fallback.day.isoformat())
+        self.fallback = fallback
+
+
+def _fetch_weather_or_raise(day_iso: str, tz: str) -> WeatherSummary:
+    summary = fetch_weather_for_day(
+        date.fromisoformat(day_iso), timezone=tz, session=_get_http_session()
     )
+    if (
+        summary.temperature_max_c is None
+        and summary.temperature_min_c is None
+        and summary.precipitation_probability_pct is None
+        and summary.precipitation_sum_mm is None
+        and summary.wind_speed_max_kmh is None
+    ):
+        # fetch_weather_for_day swallows request errors into an empty summary.
+        raise _WeatherUnavailable(summary)
+    return summary
+
 
+@st.cache_data(show_spinner=False, ttl=1800, max_entries=64)
+def _get_forecast_weather(day_iso: str, tz: str) -> WeatherSummary:
+    return _fetch_weather_or_raise(day_iso, tz)
 
-@st.cache_data(show_spinner=False)
-def _load_adventures() -> list[MicroAdventure]:
-    return seed_adventures()
+
+@st.cache_data(show_spinner=False, persist="disk", max_entries=256)
+def _get_past_weather(day_iso: str, tz: str) -> WeatherSummary:
+    # Past days no longer change upstream, so measurements are persisted to
+    # disk and survive restarts (Streamlit ignores ttl for persisted caches).
+    # Failed fetches raise instead of being cached, so only real data lands.
+    return _fetch_weather_or_raise(day_iso, tz)
+
+
+@st.cache_resource(show_spinner=False)
+def _recent_weather_failures() -> tuple[
+    dict[tuple[str, str], tuple[float, WeatherSummary]], threading.Lock
+]:
+    # Shared by every session thread; the lock guards iteration and writes.
+    return {}, threading.Lock()
 
 
-@st.cache_data(show_spinner=False, ttl=1800)
 def _get_weather(day_iso: str, tz: str) -> WeatherSummary:
-    y, m, d = map(int, day_iso.split("-"))
-    return fetch_weather_for_day(date(y, m, d), timezone=tz)
+    """Return cached weather, keyed on the ISO day and a canonical timezone.
+
+    Failed fetches are remembered for ``WEATHER_FAILURE_TTL_S`` only, so an
+    outage neither re-hits Open-Meteo on every rerun nor pins the fallback
+    summary for the full forecast/past TTL.
+    """
+    tz = tz.strip() or DEFAULT_TIMEZONE
+    key = (day_iso, tz)
+    failures, lock = _recent_weather_failures()
+    now = time_module.monotonic()
+    with lock:
+        failed = failures.get(key)
+    if failed is not None and now - failed[0] < WEATHER_FAILURE_TTL_S:
+        return failed[1]
+
+    fetch = (
+        _get_past_weather
+        if date.fromisoformat(day_iso) < date.today()
+        else _get_forecast_weather
+    )
+    try:
+        weather = fetch(day_iso, tz)
+    except _WeatherUnavailable as exc:
+        with lock:
+            for stale_key in [
+                k
+                for k, (at, _) in failures.items()
+                if now - at >= WEATHER_FAILURE_TTL_S
+            ]:
+                failures.pop(stale_key, None)
+            failures[key] = (now, exc.fallback)
+        return exc.fallback
+    with lock:
+        failures.pop(key, None)
+    return weather
 
 
 CRITERIA_DAILY_KEY = "criteria_daily"
 CRITERIA_EVENTS_KEY = "criteria_events"
 PENDING_DAILY_WIDGET_SYNC_KEY = "pending_daily_widget_sync"
 LANDING_QUICK_FILTERS_APPLIED_KEY = "landing_quick_filters_applied"
+LAST_VALID_CRITERIA_KEY_PREFIX = "_last_valid_criteria_"
+
+
+def _time_after_minutes(start: time, minutes: int) -> time:
+    # Wraps past midnight like datetime arithmetic would, so TimeWindow still
+    # rejects windows that end on the next day.
+    total = (start.hour * 60 + start.minute + minutes) % (24 * 60)
+    return start.replace(hour=total // 60, minute=total % 60)
 
 
 def _default_criteria(cfg: AppConfig) -> ActivitySearchCriteria:
     default_date = date.today()
     default_start = time(hour=9, minute=0)
     default_effort = (
-        cfg.default_effort
-        if cfg.default_effort in {"niedrig", "mittel", "hoch"}
-        else "mittel"
+        cfg.default_effort if cfg.default_effort in EFFORT_INDEX else "mittel"
     )
     return ActivitySearchCriteria(
         plz=cfg.default_postal_code,
@@ -510,10 +783,7 @@ def _default_criteria(cfg: AppConfig) -> ActivitySearchCriteria:
         date=default_date,
         time_window=TimeWindow(
             start=default_start,
-            end=(
-                datetime.combine(default_date, default_start)
-                + timedelta(minutes=int(cfg.default_available_minutes))
-            ).time(),
+            end=_time_after_minutes(default_start, int(cfg.default_available_minutes)),
         ),
         effort=cast(Literal["niedrig", "mittel", "hoch"], default_effort),
         budget_eur_max=cfg.default_budget_eur,
@@ -533,58 +803,32 @@ def get_criteria_state(
     return cast(ActivitySearchCriteria, st.session_state[key])
 
 
-CRITERIA_WIDGET_FIELDS: tuple[str, ...] = (
-    "plz",
-    "radius_km",
-    "date",
-    "start_time",
-    "available_minutes",
-    "effort",
-    "budget_eur_max",
-    "child_age_years",
-    "topics",
-    "location_preference",
-    "goals",
-    "constraints",
-    "available_materials",
-)
-
-
 def _criteria_to_widget_values(criteria: ActivitySearchCriteria) -> dict[str, Any]:
-    available_minutes = max(
-        15,
-        int(
-            (
-                datetime.combine(criteria.date, criteria.end_time)
-                - datetime.combine(criteria.date, criteria.start_time)
-            ).total_seconds()
-            // 60
-        ),
-    )
     return {
         "plz": criteria.plz,
         "radius_km": float(criteria.radius_km),
         "date": criteria.date,
         "start_time": criteria.start_time,
-        "available_minutes": available_minutes,
+        "available_minutes": max(15, criteria.available_minutes),
         "effort": criteria.effort,
         "budget_eur_max": float(criteria.budget_eur_max),
         "child_age_years": float(criteria.child_age_years),
-        "topics": list(criteria.topics),
+        "topics": criteria.topics,
         "location_preference": criteria.location_preference,
-        "goals": list(criteria.goals),
-        "constraints": list(criteria.constraints),
-        "available_materials": list(criteria.available_materials),
+        "goals": criteria.goals,
+        "constraints": criteria.constraints,
+        "available_materials": criteria.available_materials,
     }
 
 
 def _ensure_ui_adapter_state(
     namespace: CriteriaNamespace, criteria: ActivitySearchCriteria
 ) -> None:
-    keys = CriteriaKeySpace(namespace)
+    required, _ = widget_key_pairs(namespace)
+    if all(key in st.session_state for _, key in required):
+        return
     widget_values = _criteria_to_widget_values(criteria)
-    for field in CRITERIA_WIDGET_FIELDS:
-        key = keys.widget(field)
+    for field, key in required:
         if key not in st.session_state:
             st.session_state[key] = widget_values[field]
 
@@ -611,9 +855,16 @@ def _apply_pending_daily_widget_sync() -> None:
         return
 
     keyspace = CriteriaKeySpace("daily")
+    changed = False
     for field, value in pending_values.items():
-        st.session_state[keyspace.widget(field)] = value
+        key = keyspace.widget(field)
+        if st.session_state.get(key) != value:
+            st.session_state[key] = value
+            changed = True
 
+    if not changed and CRITERIA_DAILY_KEY in st.session_state:
+        # Quick filters re-submitted without edits: nothing to revalidate.
+        return
     _sync_widget_change_to_criteria(namespace="daily", state_key=CRITERIA_DAILY_KEY)
 
 
@@ -635,33 +886,11 @@ class NormalizedWidgetInput:
 
 
 def _collect_widget_raw_values(namespace: CriteriaNamespace) -> dict[str, Any]:
-    keys = CriteriaKeySpace(namespace)
-    raw_values: dict[str, Any] = {
-        "plz": st.session_state[keys.widget("plz")],
-        "radius_km": st.session_state[keys.widget("radius_km")],
-        "date": st.session_state[keys.widget("date")],
-        "start_time": st.session_state[keys.widget("start_time")],
-        "available_minutes": st.session_state[keys.widget("available_minutes")],
-        "effort": st.session_state[keys.widget("effort")],
-        "budget_eur_max": st.session_state[keys.widget("budget_eur_max")],
-        "child_age_years": st.session_state[keys.widget("child_age_years")],
-        "topics": st.session_state[keys.widget("topics")],
-        "location_preference": st.session_state[keys.widget("location_preference")],
-        "goals": st.session_state[keys.widget("goals")],
-        "constraints": st.session_state[keys.widget("constraints")],
-        "available_materials": st.session_state[keys.widget("available_materials")],
-        "constraints_optional": st.session_state.get(
-            keys.widget("constraints_optional"), ""
-        ),
-        "extra_context": st.session_state.get(keys.widget("extra_context"), ""),
-    }
-    if namespace == "events":
-        raw_values["pref_outdoor"] = st.session_state.get(
-            keys.widget("pref_outdoor"), False
-        )
-        raw_values["pref_indoor"] = st.session_state.get(
-            keys.widget("pref_indoor"), False
-        )
+    state = st.session_state
+    required, optional = widget_key_pairs(namespace)
+    raw_values: dict[str, Any] = {field: state[key] for field, key in required}
+    for field, key, default in optional:
+        raw_values[field] = state.get(key, default)
     return raw_values
 
 
@@ -708,18 +937,21 @@ def normalize_widget_input(
     mode: CriteriaNamespace,
     max_input_chars: int,
 ) -> NormalizedWidgetInput:
-    constraints = list(cast(list[str], raw_values.get("constraints", [])))
+    # Widget values are fresh lists per rerun and never mutated here, so they
+    # are passed through; only the merged constraints need a new list.
     constraints = list(
         dict.fromkeys(
-            constraints
-            + _normalize_optional_constraints(raw_values)
-            + _normalize_extra_context_constraint(
-                raw_values, max_input_chars=max_input_chars
-            )
+            [
+                *cast(list[str], raw_values.get("constraints", [])),
+                *_normalize_optional_constraints(raw_values),
+                *_normalize_extra_context_constraint(
+                    raw_values, max_input_chars=max_input_chars
+                ),
+            ]
         )
     )
 
-    goals = list(cast(list[DevelopmentDomain], raw_values.get("goals", [])))
+    goals = cast(list[DevelopmentDomain], raw_values.get("goals", []))
     return NormalizedWidgetInput(
         plz=str(raw_values.get("plz", "")),
         radius_km=float(raw_values.get("radius_km", 0.0)),
@@ -729,16 +961,20 @@ def normalize_widget_input(
         effort=cast(Literal["niedrig", "mittel", "hoch"], raw_values.get("effort")),
         budget_eur_max=float(raw_values.get("budget_eur_max", 0.0)),
         child_age_years=float(raw_values.get("child_age_years", 0.0)),
-        topics=list(cast(list[str], raw_values.get("topics", []))),
+        topics=cast(list[str], raw_values.get("topics", [])),
         location_preference=_normalize_location_preference(raw_values, mode=mode),
         goals=goals if goals else [DevelopmentDomain.language],
         constraints=constraints,
-        available_materials=list(
-            cast(list[str], raw_values.get("available_materials", []))
-        ),
+        available_materials=cast(list[str], raw_values.get("available_materials", [])),
     )
 
 
+_CRITERIA_ADAPTER: TypeAdapter[ActivitySearchCriteria] = TypeAdapter(
+    ActivitySearchCriteria
+)
+_PLZ_RE = re.compile(r"^\d{5}$")
+
+
 def _build_criteria_from_widget_state(
     *, namespace: CriteriaNamespace
 ) -> ActivitySearchCriteria:
@@ -748,27 +984,52 @@ def _build_criteria_from_widget_state(
         mode=namespace,
         max_input_chars=int(st.session_state.get("cfg_max_input_chars", 4000)),
     )
+    # Most reruns are triggered by unrelated widgets; reuse the last validated
+    # criteria when the normalized input is unchanged.
+    memo_key = f"{LAST_VALID_CRITERIA_KEY_PREFIX}{namespace}"
+    memo = st.session_state.get(memo_key)
+    if memo is not None and memo[0] == normalized:
+        return cast(ActivitySearchCriteria, memo[1])
+
+    plz = normalized.plz.strip()
+    if _PLZ_RE.fullmatch(plz) is None:
+        # Cheap pre-check for the most common typing state (incomplete PLZ);
+        # skips building the full model and mirrors its validator message.
+        raise ValidationError.from_exception_data(
+            ActivitySearchCriteria.__name__,
+            [
+                {
+                    "type": "value_error",
+                    "loc": ("plz",),
+                    "input": normalized.plz,
+                    "ctx": {"error": ValueError("plz must contain exactly 5 digits")},
+                }
+            ],
+        )
 
-    return ActivitySearchCriteria(
-        plz=normalized.plz,
-        radius_km=normalized.radius_km,
-        date=normalized.date_value,
-        time_window=TimeWindow(
-            start=normalized.start_time,
-            end=(
-                datetime.combine(normalized.date_value, normalized.start_time)
-                + timedelta(minutes=normalized.available_minutes)
-            ).time(),
-        ),
-        effort=normalized.effort,
-        budget_eur_max=normalized.budget_eur_max,
-        child_age_years=normalized.child_age_years,
-        topics=normalized.topics,
-        location_preference=normalized.location_preference,
-        goals=normalized.goals,
-        constraints=normalized.constraints,
-        available_materials=normalized.available_materials,
+    criteria = _CRITERIA_ADAPTER.validate_python(
+        {
+            "plz": plz,
+            "radius_km": normalized.radius_km,
+            "date": normalized.date_value,
+            "time_window": {
+                "start": normalized.start_time,
+                "end": _time_after_minutes(
+                    normalized.start_time, normalized.available_minutes
+                ),
+            },
+            "effort": normalized.effort,
+            "budget_eur_max": normalized.budget_eur_max,
+            "child_age_years": normalized.child_age_years,
+            "topics": normalized.topics,
+            "location_preference": normalized.location_preference,
+            "goals": normalized.goals,
+            "constraints": normalized.constraints,
+            "available_materials": normalized.available_materials,
+        }
     )
+    st.session_state[memo_key] = (normalized, criteria)
+    return criteria
 
 
 def _render_criteria_validation_error(exc: ValidationError, *, lang: Language) -> None:
@@ -801,161 +1062,150 @@ def _criteria_sidebar(
     st.sidebar.divider()
     st.sidebar.header(_t(lang, "Suche kompakt", "Compact search"))
 
-    on_change_kwargs = {"namespace": "daily", "state_key": CRITERIA_DAILY_KEY}
-    formatters = {
-        "effort": lambda value: effort_label(value, lang),
-        "topics": lambda value: theme_label(value, lang),
-        "goals": lambda goal: DOMAIN_LABELS[cast(DevelopmentDomain, goal)],
-        "available_materials": _material_label,
-    }
-
-    render_filter_fields(
-        _core_specs_by_id("date"),
-        namespace=CriteriaKeySpace("daily").session_prefix,
-        mode="sidebar",
-        lang=lang,
-        on_change_handler=_sync_widget_change_to_criteria,
-        on_change_kwargs=on_change_kwargs,
-        container=st.sidebar,
-        formatters=formatters,
-    )
+    formatters = _filter_formatters(lang)
 
-    age_band_labels = [label for label, _ in AGE_BAND_OPTIONS]
-    age_band_map = dict(AGE_BAND_OPTIONS)
-    current_age = float(st.session_state.get("profile_child_age_years", 2.5))
-    current_band = min(AGE_BAND_OPTIONS, key=lambda item: abs(item[1] - current_age))[0]
-    selected_age_band = st.sidebar.selectbox(
-        _t(
-            lang,
-            "Altersband",
-            "Age band",
-        ),
-        options=age_band_labels,
-        index=age_band_labels.index(current_band),
-        key="profile_child_age_band",
-    )
-    child_age_years = age_band_map[selected_age_band]
-    st.session_state["profile_child_age_years"] = float(child_age_years)
-    st.session_state[CriteriaKeySpace("daily").widget("child_age_years")] = float(
-        child_age_years
-    )
-
-    st.sidebar.caption(
-        _t(
-            lang,
-            "Essentiell: Datum + Altersband. Weitere Filter über die Gruppen unten.",
-            "Essential: date + age band. More filters in the groups below.",
-        )
-    )
+    st.session_state["use_weather"] = bool(st.session_state.get("use_weather", True))
+    st.session_state["use_ai"] = bool(st.session_state.get("use_ai", cfg.enable_llm))
 
-    with st.sidebar.expander(
-        _t(
-            lang,
-            "Ort & Zeit anzeigen / Show location & time",
-            "Show location & time / Ort & Zeit anzeigen",
-        ),
-        expanded=False,
-    ):
+    # One form for all sidebar inputs: typing or dragging a slider no longer
+    # reruns the whole page (weather, plan generation); only submitting does.
+    form = st.sidebar.form("criteria_form", border=False)
+    with form:
         render_filter_fields(
-            _core_specs_by_id("plz", "radius_km", "start_time", "available_minutes"),
+            _core_specs_by_id("date"),
             namespace=CriteriaKeySpace("daily").session_prefix,
             mode="sidebar",
             lang=lang,
-            on_change_handler=_sync_widget_change_to_criteria,
-            on_change_kwargs=on_change_kwargs,
+            container=form,
             formatters=formatters,
         )
-        st.segmented_control(
-            _t(lang, "Ort", "Location"),
-            options=["mixed", "outdoor", "indoor"],
-            format_func=lambda opt: {
-                "mixed": "Gemischt" if lang == "DE" else "Mixed",
-                "outdoor": "Draußen" if lang == "DE" else "Outdoor",
-                "indoor": "Drinnen" if lang == "DE" else "Indoor",
-            }[opt],
-            key=CriteriaKeySpace("daily").widget("location_preference"),
-            on_change=_sync_widget_change_to_criteria,
-            kwargs=on_change_kwargs,
-        )
 
-    with st.sidebar.expander(
-        _t(
-            lang,
-            "Suche verfeinern anzeigen / Show advanced search",
-            "Show advanced search / Suche verfeinern anzeigen",
-        ),
-        expanded=False,
-    ):
-        render_filter_fields(
-            _core_specs_by_id(
-                "effort",
-                "goals",
-                "budget_eur_max",
-                "topics",
-                "constraints",
-                "available_materials",
+        current_age = float(st.session_state.get("profile_child_age_years", 2.5))
+        selected_age_band = form.selectbox(
+            _t(
+                lang,
+                "Altersband",
+                "Age band",
             ),
-            namespace=CriteriaKeySpace("daily").session_prefix,
-            mode="sidebar",
-            lang=lang,
-            on_change_handler=_sync_widget_change_to_criteria,
-            on_change_kwargs=on_change_kwargs,
-            formatters=formatters,
+            options=AGE_BAND_LABELS,
+            index=_nearest_age_band_index(current_age),
+            key="profile_child_age_band",
         )
-
-    st.session_state["use_weather"] = bool(st.session_state.get("use_weather", True))
-    st.session_state["use_ai"] = bool(st.session_state.get("use_ai", cfg.enable_llm))
-
-    with st.sidebar.expander(
-        _t(
-            lang,
-            "Profil & Optionen anzeigen / Show profile & options",
-            "Show profile & options / Profil & Optionen anzeigen",
-        ),
-        expanded=False,
-    ):
-        st.text_input(
-            _t(lang, "Name des Kindes", "Name of child"),
-            value=st.session_state.get("profile_child_name", ""),
-            key="profile_child_name",
+        child_age_years = AGE_BAND_YEARS[selected_age_band]
+        st.session_state["profile_child_age_years"] = float(child_age_years)
+        st.session_state[CriteriaKeySpace("daily").widget("child_age_years")] = float(
+            child_age_years
         )
-        st.text_input(
-            _t(lang, "Name der Eltern", "Parent name(s)"),
-            value=st.session_state.get("profile_parent_names", ""),
-            key="profile_parent_names",
-        )
-        st.selectbox(
-            _t(lang, "Sprache", "Language"),
-            options=["DE"],
-            index=0,
-            key="lang",
+
+        form.caption(
+            _t(
+                lang,
+                "Essentiell: Datum + Altersband. Weitere Filter über die Gruppen unten.",
+                "Essential: date + age band. More filters in the groups below.",
+            )
         )
-        st.text_input(
+
+        with form.expander(
             _t(
                 lang,
-                "Weitere Rahmenbedingungen (optional, max 80)",
-                "Additional constraints (optional, max 80)",
+                "Ort & Zeit anzeigen / Show location & time",
+                "Show location & time / Ort & Zeit anzeigen",
             ),
-            key=CriteriaKeySpace("daily").widget("constraints_optional"),
-            max_chars=80,
-        )
-        st.text_area(
-            _t(lang, "Zusätzlicher Kontext", "Additional context"),
-            key=CriteriaKeySpace("daily").widget("extra_context"),
-            help=_t(
+            expanded=False,
+        ):
+            render_filter_fields(
+                _core_specs_by_id(
+                    "plz", "radius_km", "start_time", "available_minutes"
+                ),
+                namespace=CriteriaKeySpace("daily").session_prefix,
+                mode="sidebar",
+                lang=lang,
+                formatters=formatters,
+            )
+            st.segmented_control(
+                _t(lang, "Ort", "Location"),
+                options=LOCATION_OPTIONS,
+                format_func=_LOCATION_LABELS[lang].__getitem__,
+                key=CriteriaKeySpace("daily").widget("location_preference"),
+            )
+
+        with form.expander(
+            _t(
                 lang,
-                f"Wird auf {cfg.max_input_chars} Zeichen begrenzt.",
-                f"Will be limited to {cfg.max_input_chars} characters.",
+                "Suche verfeinern anzeigen / Show advanced search",
+                "Show advanced search / Suche verfeinern anzeigen",
             ),
-        )
-        st.toggle(
+            expanded=False,
+        ):
+            render_filter_fields(
+                _core_specs_by_id(
+                    "effort",
+                    "goals",
+                    "budget_eur_max",
+                    "topics",
+                    "constraints",
+                    "available_materials",
+                ),
+                namespace=CriteriaKeySpace("daily").session_prefix,
+                mode="sidebar",
+                lang=lang,
+                formatters=formatters,
+            )
+
+        with form.expander(
             _t(
                 lang,
-                "Offline-Modus (ohne LLM)",
-                "Offline mode (without LLM)",
+                "Profil & Optionen anzeigen / Show profile & options",
+                "Show profile & options / Profil & Optionen anzeigen",
             ),
-            value=st.session_state.get("offline_mode", False),
-            key="offline_mode",
+            expanded=False,
+        ):
+            st.text_input(
+                _t(lang, "Name des Kindes", "Name of child"),
+                value=st.session_state.get("profile_child_name", ""),
+                key="profile_child_name",
+            )
+            st.text_input(
+                _t(lang, "Name der Eltern", "Parent name(s)"),
+                value=st.session_state.get("profile_parent_names", ""),
+                key="profile_parent_names",
+            )
+            st.selectbox(
+                _t(lang, "Sprache", "Language"),
+                options=["DE"],
+                index=0,
+                key="lang",
+            )
+            st.text_input(
+                _t(
+                    lang,
+                    "Weitere Rahmenbedingungen (optional, max 80)",
+                    "Additional constraints (optional, max 80)",
+                ),
+                key=CriteriaKeySpace("daily").widget("constraints_optional"),
+                max_chars=80,
+            )
+            st.text_area(
+                _t(lang, "Zusätzlicher Kontext", "Additional context"),
+                key=CriteriaKeySpace("daily").widget("extra_context"),
+                help=_t(
+                    lang,
+                    f"Wird auf {cfg.max_input_chars} Zeichen begrenzt.",
+                    f"Will be limited to {cfg.max_input_chars} characters.",
+                ),
+            )
+            st.toggle(
+                _t(
+                    lang,
+                    "Offline-Modus (ohne LLM)",
+                    "Offline mode (without LLM)",
+                ),
+                value=st.session_state.get("offline_mode", False),
+                key="offline_mode",
+            )
+        form.form_submit_button(
+            _t(lang, "Aktualisieren", "Update"),
+            type="primary",
         )
 
     child_name = _profile_name_or_fallback(
@@ -989,6 +1239,62 @@ def _criteria_sidebar(
         )
 
 
+ACTIVITY_PLAN_CACHE_KEY = "activity_plan_cache"
+ACTIVITY_PLAN_CACHE_MAX_ENTRIES = 8
+
+
+def _activity_plan_cache_key(
+    cfg: AppConfig,
+    picked: MicroAdventure,
+    criteria: ActivitySearchCriteria,
+    weather: Optional[WeatherSummary],
+    plan_mode: str,
+) -> str:
+    """Content digest of every input that shapes an LLM-generated plan."""
+    # The prompt carries the profiled adventure (child/parent names, age), not
+    # just its slug, so the whole adventure goes into the key.
+    digest_input = orjson.dumps(
+        [
+            cfg.openai_model_plan,
+            cfg.enable_web_search,
+            cfg.max_output_tokens,
+            asdict(picked),
+            criteria.model_dump(mode="json"),
+            asdict(weather) if weather else None,
+            plan_mode,
+        ]
+    )
+    return hashlib.sha256(digest_input).hexdigest()
+
+
+def _plan_retry_delay_s(cfg: AppConfig, attempt: int) -> float:
+    """Capped exponential backoff with multiplicative jitter for plan retries."""
+    delay = min(
+        cfg.plan_retry_max_delay_s,
+        cfg.plan_retry_base_delay_s * (2**attempt),
+    )
+    return delay * (1 + random.uniform(0, cfg.plan_retry_jitter))
+
+
+@st.cache_resource(show_spinner=False)
+def _plan_breaker() -> CircuitBreaker:
+    # Shared by all sessions and the plan worker threads, and kept across
+    # reruns: once the provider keeps failing, further plans skip straight to
+    # the fallback instead of backing off.
+    return CircuitBreaker()
+
+
+def _plan_breaker_open(cfg: AppConfig) -> bool:
+    return _plan_breaker().is_open(
+        threshold=cfg.plan_breaker_threshold,
+        cooldown_s=cfg.plan_breaker_cooldown_s,
+    )
+
+
+def _record_plan_attempt(*, ok: bool) -> None:
+    _plan_breaker().record(ok=ok)
+
+
 def _generate_activity_plan_with_retry(
     cfg: AppConfig,
     picked: MicroAdventure,
@@ -997,39 +1303,90 @@ def _generate_activity_plan_with_retry(
     lang: Language,
     plan_mode: Literal["standard", "parent_script"],
 ) -> ActivityPlan:
-    attempts = 3
-    wait_s = 1.0
-    last_err: Optional[Exception] = None
+    use_llm = bool(st.session_state.get("use_ai", False)) and cfg.enable_llm
+    plan_cache: dict[str, ActivityPlan] = st.session_state.setdefault(
+        ACTIVITY_PLAN_CACHE_KEY, {}
+    )
+    cache_key = _activity_plan_cache_key(cfg, picked, criteria, weather, plan_mode)
+    if use_llm and cache_key in plan_cache:
+        # UI-only reruns (expanders, downloads, events) must not bill a new call.
+        return plan_cache[cache_key]
 
     if not _consume_request_budget(cfg, lang=lang, scope="activity-plan"):
-        cfg_payload = {**cfg.__dict__, "enable_llm": False}
         return generate_activity_plan(
-            cfg.__class__(**cfg_payload),
-            picked,
-            criteria,
-            weather,
-            plan_mode=plan_mode,
+            offline_config(cfg), picked, criteria, weather, plan_mode=plan_mode
         )
 
-    cfg_payload = {**cfg.__dict__}
-    if not st.session_state.get("use_ai", False):
-        cfg_payload["enable_llm"] = False
-    cfg_runtime = cfg.__class__(**cfg_payload)
+    if not use_llm:
+        # Deterministic fallback path: no network I/O, so no retries needed.
+        return generate_activity_plan(
+            offline_config(cfg), picked, criteria, weather, plan_mode=plan_mode
+        )
 
-    for _ in range(attempts):
+    try:
+        plan = _generate_llm_plan_with_retries(
+            cfg, picked, criteria, weather, plan_mode
+        )
+    except ActivityGenerationError as exc:
+        return _fallback_plan_after_failure(
+            cfg, picked, criteria, weather, lang, plan_mode, exc
+        )
+    _store_cached_plan(plan_cache, cache_key, plan)
+    return plan
+
+
+def _generate_llm_plan_with_retries(
+    cfg: AppConfig,
+    picked: MicroAdventure,
+    criteria: ActivitySearchCriteria,
+    weather: Optional[WeatherSummary],
+    plan_mode: Literal["standard", "parent_script"],
+) -> ActivityPlan:
+    # No Streamlit state in here: this also runs on the background plan worker.
+    last_err: Optional[ActivityGenerationError] = None
+    last_attempt = cfg.plan_retry_max_attempts - 1
+    for attempt in range(cfg.plan_retry_max_attempts):
+        if _plan_breaker_open(cfg):
+            raise last_err or ActivityGenerationError(
+                "Die KI-Planung ist nach wiederholten Fehlern kurz pausiert. / "
+                "AI planning is briefly paused after repeated failures."
+            )
         try:
-            return generate_activity_plan(
-                cfg_runtime,
+            plan = generate_activity_plan(
+                cfg,
                 picked,
                 criteria,
                 weather,
                 plan_mode=plan_mode,
             )
         except ActivityGenerationError as exc:
+            _record_plan_attempt(ok=False)
             last_err = exc
-            time_module.sleep(wait_s)
-            wait_s *= 2
+            if attempt < last_attempt and not _plan_breaker_open(cfg):
+                time_module.sleep(_plan_retry_delay_s(cfg, attempt))
+            continue
+        _record_plan_attempt(ok=True)
+        return plan
+    raise last_err or ActivityGenerationError("no plan attempts configured")
 
+
+def _store_cached_plan(
+    plan_cache: dict[str, ActivityPlan], cache_key: str, plan: ActivityPlan
+) -> None:
+    if len(plan_cache) >= ACTIVITY_PLAN_CACHE_MAX_ENTRIES:
+        plan_cache.pop(next(iter(plan_cache)))
+    plan_cache[cache_key] = plan
+
+
+def _fallback_plan_after_failure(
+    cfg: AppConfig,
+    picked: MicroAdventure,
+    criteria: ActivitySearchCriteria,
+    weather: Optional[WeatherSummary],
+    lang: Language,
+    plan_mode: Literal["standard", "parent_script"],
+    error: Exception,
+) -> ActivityPlan:
     st.error(
         _t(
             lang,
@@ -1037,26 +1394,107 @@ def _generate_activity_plan_with_retry(
             "",
         )
     )
-    if last_err:
-        st.caption(str(last_err))
-    cfg_payload["enable_llm"] = False
+    st.caption(str(error))
     return generate_activity_plan(
-        cfg.__class__(**cfg_payload),
-        picked,
-        criteria,
-        weather,
-        plan_mode=plan_mode,
+        offline_config(cfg), picked, criteria, weather, plan_mode=plan_mode
+    )
+
+
+PLAN_FUTURE_KEY = "activity_plan_future"
+
+
+@st.cache_resource(show_spinner=False)
+def _plan_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="activity-plan")
+
+
+def _cancel_pending_plan() -> None:
+    pending = cast(
+        Optional[tuple[str, Future[ActivityPlan]]],
+        st.session_state.pop(PLAN_FUTURE_KEY, None),
     )
+    if pending is not None:
+        # The pool is shared by all sessions: a superseded job still queued
+        # must not hold a worker (and its retries) for a result nobody reads.
+        # A job that already runs cannot be cancelled and finishes unread.
+        pending[1].cancel()
+
+
+def _activity_plan_or_pending(
+    cfg: AppConfig,
+    picked: MicroAdventure,
+    criteria: ActivitySearchCriteria,
+    weather: Optional[WeatherSummary],
+    lang: Language,
+    plan_mode: Literal["standard", "parent_script"],
+) -> tuple[ActivityPlan, bool]:
+    """Return the plan to show now and whether an AI plan is still pending.
+
+    Uncached AI plans are generated on a worker thread so the page renders
+    right away with the deterministic plan; a polling fragment reruns the app
+    once the worker is done. Everything else stays synchronous.
+    """
+    use_llm = bool(st.session_state.get("use_ai", False)) and cfg.enable_llm
+    plan_cache: dict[str, ActivityPlan] = st.session_state.setdefault(
+        ACTIVITY_PLAN_CACHE_KEY, {}
+    )
+    cache_key = _activity_plan_cache_key(cfg, picked, criteria, weather, plan_mode)
+    if not use_llm or cache_key in plan_cache:
+        _cancel_pending_plan()
+        plan = _generate_activity_plan_with_retry(
+            cfg, picked, criteria, weather, lang, plan_mode=plan_mode
+        )
+        return plan, False
+
+    pending = cast(
+        Optional[tuple[str, Future[ActivityPlan]]],
+        st.session_state.get(PLAN_FUTURE_KEY),
+    )
+    if pending is None or pending[0] != cache_key:
+        # New inputs supersede an older job.
+        _cancel_pending_plan()
+        if not _consume_request_budget(cfg, lang=lang, scope="activity-plan"):
+            plan = generate_activity_plan(
+                offline_config(cfg), picked, criteria, weather, plan_mode=plan_mode
+            )
+            return plan, False
+        future = _plan_executor().submit(
+            _generate_llm_plan_with_retries, cfg, picked, criteria, weather, plan_mode
+        )
+        st.session_state[PLAN_FUTURE_KEY] = (cache_key, future)
+    else:
+        future = pending[1]
+
+    if not future.done():
+        placeholder = generate_activity_plan(
+            offline_config(cfg), picked, criteria, weather, plan_mode=plan_mode
+        )
+        return placeholder, True
+
+    st.session_state.pop(PLAN_FUTURE_KEY, None)
+    try:
+        plan = future.result()
+    except ActivityGenerationError as exc:
+        plan = _fallback_plan_after_failure(
+            cfg, picked, criteria, weather, lang, plan_mode, exc
+        )
+        return plan, False
+    _store_cached_plan(plan_cache, cache_key, plan)
+    return plan, False
+
+
+def _render_plan_status() -> None:
+    pending = st.session_state.get(PLAN_FUTURE_KEY)
+    if pending is None or pending[1].done():
+        # Full rerun so the finished plan replaces the placeholder.
+        st.rerun(scope="app")
 
 
 def _render_landing_quick_filters(
     *, lang: Language
 ) -> tuple[bool, Optional[ValidationError]]:
     namespace = CriteriaKeySpace("daily")
-    age_band_labels = [label for label, _ in AGE_BAND_OPTIONS]
-    age_band_map = dict(AGE_BAND_OPTIONS)
     current_age = float(st.session_state.get("profile_child_age_years", 2.5))
-    current_band = min(AGE_BAND_OPTIONS, key=lambda item: abs(item[1] - current_age))[0]
 
     with st.expander(
         _t(lang, "Suche (Schnellzugriff)", "Search (quick access)"),
@@ -1075,8 +1513,8 @@ def _render_landing_quick_filters(
                 )
                 age_band = st.selectbox(
                     _t(lang, "Altersband", "Age band"),
-                    options=age_band_labels,
-                    index=age_band_labels.index(current_band),
+                    options=AGE_BAND_LABELS,
+                    index=_nearest_age_band_index(current_age),
                     key="landing_quick_child_age_band",
                 )
                 plz = st.text_input(
@@ -1117,12 +1555,8 @@ def _render_landing_quick_filters(
                 )
                 location_preference = st.segmented_control(
                     _t(lang, "Ort", "Location"),
-                    options=["mixed", "outdoor", "indoor"],
-                    format_func=lambda opt: {
-                        "mixed": "Gemischt" if lang == "DE" else "Mixed",
-                        "outdoor": "Draußen" if lang == "DE" else "Outdoor",
-                        "indoor": "Drinnen" if lang == "DE" else "Indoor",
-                    }[opt],
+                    options=LOCATION_OPTIONS,
+                    format_func=_LOCATION_LABELS[lang].__getitem__,
                     default=cast(
                         str,
                         st.session_state.get(
@@ -1135,16 +1569,16 @@ def _render_landing_quick_filters(
                     Literal["niedrig", "mittel", "hoch"],
                     st.selectbox(
                         _t(lang, "Aufwand", "Effort"),
-                        options=["niedrig", "mittel", "hoch"],
-                        format_func=lambda value: effort_label(value, lang),
-                        index=["niedrig", "mittel", "hoch"].index(
+                        options=EFFORT_LEVELS,
+                        format_func=_filter_formatters(lang)["effort"],
+                        index=EFFORT_INDEX[
                             cast(
                                 str,
                                 st.session_state.get(
                                     namespace.widget("effort"), "mittel"
                                 ),
                             )
-                        ),
+                        ],
                         key="landing_quick_effort",
                     ),
                 )
@@ -1168,26 +1602,24 @@ def _render_landing_quick_filters(
                             st.session_state.get(namespace.widget("topics"), []),
                         )
                     ),
-                    format_func=lambda value: theme_label(value, lang),
+                    format_func=_filter_formatters(lang)["topics"],
                     key="landing_quick_topics",
                 )
                 goals = st.multiselect(
                     _t(lang, "Ziele", "Goals"),
-                    options=list(GOAL_OPTIONS),
+                    options=GOAL_OPTIONS,
                     default=list(
                         cast(
                             list[DevelopmentDomain],
                             st.session_state.get(namespace.widget("goals"), []),
                         )
                     ),
-                    format_func=lambda goal: DOMAIN_LABELS[
-                        cast(DevelopmentDomain, goal)
-                    ],
+                    format_func=_filter_formatters(lang)["goals"],
                     key="landing_quick_goals",
                 )
                 constraints = st.multiselect(
                     _t(lang, "Rahmenbedingungen", "Constraints"),
-                    options=list(CONSTRAINT_OPTIONS),
+                    options=CONSTRAINT_OPTIONS,
                     default=list(
                         cast(
                             list[str],
@@ -1198,7 +1630,7 @@ def _render_landing_quick_filters(
                 )
                 mode = st.radio(
                     _t(lang, "Genauigkeit", "Accuracy"),
-                    options=["schnell", "genau"],
+                    options=EVENT_MODE_OPTIONS,
                     format_func=lambda item: (
                         _t(lang, "Schnell", "Fast")
                         if item == "schnell"
@@ -1219,7 +1651,7 @@ def _render_landing_quick_filters(
     if not submitted:
         return False, None
 
-    st.session_state["profile_child_age_years"] = float(age_band_map[age_band])
+    st.session_state["profile_child_age_years"] = float(AGE_BAND_YEARS[age_band])
     st.session_state[PENDING_DAILY_WIDGET_SYNC_KEY] = {
         "date": date_value,
         "plz": plz,
@@ -1239,33 +1671,32 @@ def _render_landing_quick_filters(
     return True, None
 
 
+_PLAN_SECTION_HEADINGS: dict[str, str] = {
+    "## Plan": "plan",
+    "## Was das fördert": "supports",
+    "## Sicherheit": "sicherheit",
+    "## Eltern-Kind-Impulse": "impulse",
+    "## Varianten": "varianten",
+}
+
+
 def _split_markdown_sections(markdown: str) -> dict[str, str]:
-    section_map: dict[str, str] = {
-        "plan": "",
-        "supports": "",
-        "sicherheit": "",
-        "impulse": "",
-        "varianten": "",
+    section_lines: dict[str, list[str]] = {
+        key: [] for key in _PLAN_SECTION_HEADINGS.values()
     }
-    heading_map = {
-        "## Plan": "plan",
-        "## Was das fördert": "supports",
-        "## Sicherheit": "sicherheit",
-        "## Eltern-Kind-Impulse": "impulse",
-        "## Varianten": "varianten",
-    }
-    current_key: Optional[str] = None
+    current_lines: Optional[list[str]] = None
     for line in markdown.splitlines():
         stripped = line.strip()
-        if stripped in heading_map:
-            current_key = heading_map[stripped]
+        section_key = _PLAN_SECTION_HEADINGS.get(stripped)
+        if section_key is not None:
+            current_lines = section_lines[section_key]
             continue
         if stripped.startswith("# "):
             continue
-        if current_key is None:
+        if current_lines is None:
             continue
-        section_map[current_key] += f"{line}\n"
-    return {key: value.strip() for key, value in section_map.items()}
+        current_lines.append(line)
+    return {key: "\n".join(lines).strip() for key, lines in section_lines.items()}
 
 
 def render_daily_plan_sections(markdown: str, lang: Language) -> None:
@@ -1293,37 +1724,94 @@ def render_daily_plan_sections(markdown: str, lang: Language) -> None:
 
 
 def _render_adventure_details(a: MicroAdventure, lang: Language) -> None:
-    st.markdown(f"**{a.title}**  \n{a.short}")
-    cols = st.columns(4)
-    cols[0].metric(_t(lang, "Dauer", ""), f"{a.duration_minutes} min")
-    cols[1].metric(_t(lang, "Distanz", ""), f"{a.distance_km:.1f} km")
-    cols[2].metric(_t(lang, "Kinderwagen", ""), "✅" if a.stroller_ok else "—")
-    cols[3].metric(_t(lang, "Sicherheit", ""), a.safety_level)
+    # One markdown element instead of columns + metrics + a write per step.
+    st.markdown(
+        "\n".join(
+            [
+                f"**{a.title}**  \n{a.short}",
+                "",
+                (
+                    f"| {_t(lang, 'Dauer', 'Duration')} "
+                    f"| {_t(lang, 'Distanz', 'Distance')} "
+                    f"| {_t(lang, 'Kinderwagen', 'Stroller')} "
+                    f"| {_t(lang, 'Sicherheit', 'Safety')} |"
+                ),
+                "|---|---|---|---|",
+                (
+                    f"| {a.duration_minutes} min | {a.distance_km:.1f} km "
+                    f"| {'✅' if a.stroller_ok else '—'} | {a.safety_level} |"
+                ),
+                "",
+                "### " + _t(lang, "Startpunkt", "Start point"),
+                a.start_point,
+                "",
+                "### " + _t(lang, "Ablauf", "Steps"),
+                *(f"- {step}" for step in a.route_steps),
+            ]
+        )
+    )
 
-    st.markdown("### " + _t(lang, "Startpunkt", ""))
-    st.write(a.start_point)
 
-    st.markdown("### " + _t(lang, "Ablauf", ""))
-    for step in a.route_steps:
-        st.write(f"- {step}")
+SHOW_EMAIL_PREVIEW_KEY = "show_email_preview"
 
 
-def _render_export_block(
+def _email_preview_cache_key(
     picked: MicroAdventure,
     criteria: ActivitySearchCriteria,
     weather: Optional[WeatherSummary],
+) -> str:
+    weather_tags = ",".join(weather.derived_tags) if weather else ""
+    return f"{picked.slug}|{criteria.model_dump_json()}|{weather_tags}"
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _cached_email_html(
+    _picked: MicroAdventure,
+    _criteria: ActivitySearchCriteria,
+    _weather: Optional[WeatherSummary],
     markdown: str,
-    lang: Language,
-) -> None:
+    *,
+    cache_key: str,
+) -> str:
+    # Underscored args are skipped by Streamlit's hasher; ``cache_key`` and
+    # ``markdown`` fully determine the rendered HTML. Imported lazily because
+    # most sessions never open the preview. A resource cache hands back the
+    # same immutable str on every rerun instead of an unpickled copy.
+    from mikroabenteuer.email_templates import render_daily_email_html
+
+    return render_daily_email_html(
+        _picked, _criteria, _criteria.date, markdown, _weather
+    )
+
+
+def _export_json_bytes(
+    picked: MicroAdventure,
+    criteria: ActivitySearchCriteria,
+    weather: Optional[WeatherSummary],
+    markdown: str,
+) -> bytes:
+    # asdict() keeps only declared fields (orjson would serialize __dict__);
+    # orjson then emits dates as ISO strings without a default= fallback.
     json_payload = {
         "criteria": criteria.model_dump(mode="json"),
-        "weather": weather.__dict__ if weather else None,
-        "adventure": picked.__dict__,
+        "weather": asdict(weather) if weather else None,
+        "adventure": asdict(picked),
         "markdown": markdown,
     }
+    return orjson.dumps(json_payload, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _render_export_block(
+    picked: MicroAdventure,
+    criteria: ActivitySearchCriteria,
+    weather: Optional[WeatherSummary],
+    markdown: str,
+    lang: Language,
+) -> None:
     st.download_button(
         label=_t(lang, "JSON herunterladen", ""),
-        data=json.dumps(json_payload, ensure_ascii=False, indent=2, default=str),
+        # Deferred: only serialized when the user actually clicks download.
+        data=partial(_export_json_bytes, picked, criteria, weather, markdown),
         file_name=f"mikroabenteuer-{criteria.date.isoformat()}.json",
         mime="application/json",
         key="daily_export_json",
@@ -1336,26 +1824,24 @@ def _render_export_block(
         key="daily_export_md",
     )
 
-    ics_bytes = build_ics_event(
-        day=criteria.date,
-        summary=f"Mikroabenteuer: {picked.title}",
-        description=markdown,
-        location=picked.area,
-        tzid="Europe/Berlin",
-        start_time_local=criteria.start_time,
-        duration_minutes=picked.duration_minutes,
-    )
     st.download_button(
         label="ICS herunterladen",
-        data=ics_bytes,
+        # Deferred like the JSON export; each click gets a fresh UID/DTSTAMP.
+        data=partial(
+            build_ics_event,
+            day=criteria.date,
+            summary=f"Mikroabenteuer: {picked.title}",
+            description=markdown,
+            location=picked.area,
+            tzid="Europe/Berlin",
+            start_time_local=criteria.start_time,
+            duration_minutes=picked.duration_minutes,
+        ),
         file_name="mikroabenteuer.ics",
         mime="text/calendar",
         key="daily_export_ics",
     )
 
-    email_html = render_daily_email_html(
-        picked, criteria, criteria.date, markdown, weather
-    )
     with st.expander(_t(lang, "E-Mail-Vorschau", ""), expanded=False):
         st.caption(
             _t(
@@ -1364,27 +1850,93 @@ def _render_export_block(
                 "",
             )
         )
-        payload = base64.b64encode(email_html.encode("utf-8")).decode("ascii")
-        src = f"data:text/html;base64,{payload}"
-        max_data_url_length = 1_800_000
-
-        if len(src) <= max_data_url_length:
-            components.iframe(src, height=680, scrolling=True)
-        else:
-            st.caption(
-                _t(
-                    lang,
-                    "Fallback auf st.html(), da die Vorschau zu groß für data:-URL/iframe ist; Styles können dabei in den App-DOM wirken.",
-                    "",
-                )
+        if st.session_state.get(SHOW_EMAIL_PREVIEW_KEY, False) or st.button(
+            _t(lang, "Vorschau laden", "Load preview"),
+            key="daily_email_preview_load",
+        ):
+            st.session_state[SHOW_EMAIL_PREVIEW_KEY] = True
+            preview_key = _email_preview_cache_key(picked, criteria, weather)
+            email_html = _cached_email_html(
+                picked, criteria, weather, markdown, cache_key=preview_key
+            )
+            _render_email_preview(
+                email_html,
+                _email_preview_data_url(email_html, markdown, cache_key=preview_key),
+                lang,
             )
-            st.html(email_html)
 
-        with st.expander(_t(lang, "HTML-Code anzeigen", "")):
-            st.code(
-                email_html[:3000] + ("..." if len(email_html) > 3000 else ""),
-                language="html",
+
+SHOW_EMAIL_CODE_KEY = "show_email_code"
+EMAIL_CODE_PREVIEW_CHARS = 3000
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _email_preview_data_url(_email_html: str, markdown: str, *, cache_key: str) -> str:
+    # Keyed like _cached_email_html (the HTML itself is not hashed), so the
+    # base64 encoding runs once per rendered e-mail instead of every rerun.
+    payload = base64.b64encode(_email_html.encode("utf-8")).decode("ascii")
+    return f"data:text/html;base64,{payload}"
+
+
+def _email_code_preview(email_html: str) -> str:
+    if len(email_html) <= EMAIL_CODE_PREVIEW_CHARS:
+        return email_html
+    return email_html[:EMAIL_CODE_PREVIEW_CHARS] + "..."
+
+
+def _render_email_preview(email_html: str, src: str, lang: Language) -> None:
+    max_data_url_length = 1_800_000
+
+    if len(src) <= max_data_url_length:
+        components.iframe(src, height=680, scrolling=True)
+    else:
+        st.caption(
+            _t(
+                lang,
+                "Fallback auf st.html(), da die Vorschau zu groß für data:-URL/iframe ist; Styles können dabei in den App-DOM wirken.",
+                "",
             )
+        )
+        st.html(email_html)
+
+    # A toggle instead of an expander: expander bodies run on every rerun,
+    # so the code block is only built while the user actually looks at it.
+    if st.toggle(_t(lang, "HTML-Code anzeigen", ""), key=SHOW_EMAIL_CODE_KEY):
+        st.code(_email_code_preview(email_html), language="html")
+
+
+DAILY_JOB_FUTURE_KEY = "daily_job_future"
+DAILY_JOB_RESULT_KEY = "daily_job_result"
+
+
+@st.cache_resource(show_spinner=False)
+def _daily_job_executor() -> ThreadPoolExecutor:
+    # One worker per process: manual daily-job runs are rare and serialized.
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="daily-job")
+
+
+def _render_daily_job_status(lang: Language) -> None:
+    future = cast(Optional[Future[Any]], st.session_state.get(DAILY_JOB_FUTURE_KEY))
+    if future is None:
+        return
+    if not future.done():
+        st.info(_t(lang, "Daily-Job läuft…", "Daily job running…"))
+        return
+
+    st.session_state.pop(DAILY_JOB_FUTURE_KEY, None)
+    try:
+        result = future.result()
+        st.session_state[DAILY_JOB_RESULT_KEY] = (
+            "success",
+            f"OK: {result.subject} -> {result.to_email or 'n/a'}",
+        )
+    except Exception as exc:
+        st.session_state[DAILY_JOB_RESULT_KEY] = (
+            "error",
+            _t(lang, f"Automatisierung fehlgeschlagen: {exc}", ""),
+        )
+    # Full rerun so the status fragment stops polling.
+    st.rerun(scope="app")
 
 
 def _render_automation_block(
@@ -1399,23 +1951,97 @@ def _render_automation_block(
             value=False,
             key="daily_job_create_calendar_event",
         )
-        if st.button("Daily-Job jetzt ausführen", key="daily_job_run_once"):
-            try:
-                result = run_daily_job_once(
-                    cfg,
-                    criteria,
-                    send_email=send_email,
-                    create_calendar_event=create_calendar_event,
-                )
-                st.success(f"OK: {result.subject} -> {result.to_email or 'n/a'}")
-            except Exception as exc:
-                st.error(
-                    _t(
-                        lang,
-                        f"Automatisierung fehlgeschlagen: {exc}",
-                        "",
-                    )
-                )
+        job_running = DAILY_JOB_FUTURE_KEY in st.session_state
+        if st.button(
+            "Daily-Job jetzt ausführen",
+            key="daily_job_run_once",
+            disabled=job_running,
+        ):
+            from mikroabenteuer.scheduler import run_daily_job_once
+
+            # E-mail and calendar calls take seconds; run them off the script
+            # thread so the rest of the page stays interactive.
+            st.session_state.pop(DAILY_JOB_RESULT_KEY, None)
+            st.session_state[DAILY_JOB_FUTURE_KEY] = _daily_job_executor().submit(
+                run_daily_job_once,
+                cfg,
+                criteria,
+                send_email=send_email,
+                create_calendar_event=create_calendar_event,
+            )
+            job_running = True
+
+        if job_running:
+            st.fragment(_render_daily_job_status, run_every=1.0)(lang)
+
+        last_result = st.session_state.get(DAILY_JOB_RESULT_KEY)
+        if last_result is not None:
+            status, message = last_result
+            if status == "success":
+                st.success(message)
+            else:
+                st.error(message)
+
+
+EVENT_SEARCH_CACHE_TTL_S = 60 * 60
+
+
+class _EventSearchNotCacheable(Exception):
+    """Raised inside the cached search so failed or blocked results are not cached."""
+
+    def __init__(self, result: dict[str, Any]) -> None:
+        super().__init__(result.get("error_code"))
+        self.result = result
+
+
+@st.cache_data(show_spinner=False, ttl=EVENT_SEARCH_CACHE_TTL_S, max_entries=256)
+def _cached_event_search(
+    criteria_json: str,
+    weather_json: Optional[str],
+    mode: Literal["schnell", "genau"],
+    *,
+    base_url: Optional[str],
+    timeout_s: float,
+    max_input_chars: int,
+    max_output_tokens: int,
+    model_fast: str,
+    model_accurate: str,
+) -> dict[str, Any]:
+    # Keyed on canonical JSON of the inputs, so identical searches from any
+    # session within the TTL reuse one paid LLM round-trip.
+    result = openai_activity_service.suggest_activities(
+        ActivitySearchCriteria.model_validate_json(criteria_json),
+        mode=mode,
+        base_url=base_url,
+        timeout_s=timeout_s,
+        max_input_chars=max_input_chars,
+        max_output_tokens=max_output_tokens,
+        model_fast=model_fast,
+        model_accurate=model_accurate,
+        weather=(
+            EventWeatherSummary.model_validate_json(weather_json)
+            if weather_json is not None
+            else None
+        ),
+    )
+    payload = {
+        "suggestions": list(getattr(result, "suggestions", [])),
+        "sources": list(getattr(result, "sources", [])),
+        "warnings": list(getattr(result, "warnings_de_en", [])),
+        "errors": list(getattr(result, "errors_de_en", [])),
+        "error_code": getattr(result, "error_code", None),
+        "error_hint": getattr(result, "error_hint_de_en", None),
+    }
+    if payload["error_code"] is not None or payload["errors"]:
+        raise _EventSearchNotCacheable(payload)
+    return payload
+
+
+EVENTS_BREAKER_KEY = "openai_events_breaker"
+# Upstream outages count towards the breaker; input/schema problems do not.
+_EVENTS_BREAKER_FAILURE_CODES = frozenset(
+    {ERROR_CODE_RETRYABLE_UPSTREAM, ERROR_CODE_API_NON_RETRYABLE}
+)
 
 
 @dataclass
@@ -1428,9 +2054,47 @@ class OpenAIActivityService:
         weather: Optional[WeatherSummary],
         mode: str,
     ) -> dict[str, Any]:
-        try:
-            from mikroabenteuer.openai_activity_service import suggest_activities
+        """Run the live event search behind a per-session circuit breaker.
+
+        After ``events_breaker_threshold`` consecutive upstream failures the
+        search is skipped for ``events_breaker_cooldown_s`` seconds instead of
+        waiting for another timeout on each request.
+        """
+        breaker = cast(
+            Optional[CircuitBreaker], st.session_state.get(EVENTS_BREAKER_KEY)
+        )
+        if breaker is None:
+            breaker = CircuitBreaker(clock=time_module.monotonic)
+            st.session_state[EVENTS_BREAKER_KEY] = breaker
+        if breaker.is_open(
+            threshold=self.cfg.events_breaker_threshold,
+            cooldown_s=self.cfg.events_breaker_cooldown_s,
+        ):
+            return {
+                "suggestions": [],
+                "sources": [],
+                "warnings": [
+                    "Die OpenAI-Suche ist nach wiederholten Fehlern kurz pausiert. / OpenAI search is briefly paused after repeated failures."
+                ],
+                "errors": [],
+                "error_code": ERROR_CODE_RETRYABLE_UPSTREAM,
+                "error_hint": None,
+            }
 
+        result = self._search_events_once(criteria, weather, mode)
+        if result.get("error_code") in _EVENTS_BREAKER_FAILURE_CODES:
+            breaker.record(ok=False)
+        elif result.get("error_code") is None:
+            breaker.record(ok=True)
+        return result
+
+    def _search_events_once(
+        self,
+        criteria: ActivitySearchCriteria,
+        weather: Optional[WeatherSummary],
+        mode: str,
+    ) -> dict[str, Any]:
+        try:
             event_weather: EventWeatherSummary | None = None
             if weather is not None:
                 resolved_location = _resolve_location_from_plz(criteria.plz)
@@ -1469,25 +2133,20 @@ class OpenAIActivityService:
                         data_source="open-meteo",
                     )
 
-            result = suggest_activities(
-                criteria,
-                mode="genau" if mode == "genau" else "schnell",
-                base_url=os.getenv("OPENAI_BASE_URL") or None,
-                timeout_s=self.cfg.timeout_s,
-                max_input_chars=self.cfg.max_input_chars,
-                max_output_tokens=self.cfg.max_output_tokens,
-                model_fast=self.cfg.openai_model_events_fast,
-                model_accurate=self.cfg.openai_model_events_accurate,
-                weather=event_weather,
-            )
-            return {
-                "suggestions": list(getattr(result, "suggestions", [])),
-                "sources": list(getattr(result, "sources", [])),
-                "warnings": list(getattr(result, "warnings_de_en", [])),
-                "errors": list(getattr(result, "errors_de_en", [])),
-                "error_code": getattr(result, "error_code", None),
-                "error_hint": getattr(result, "error_hint_de_en", None),
-            }
+            try:
+                return _cached_event_search(
+                    criteria.model_dump_json(),
+                    event_weather.model_dump_json() if event_weather else None,
+                    "genau" if mode == "genau" else "schnell",
+                    base_url=os.getenv("OPENAI_BASE_URL") or None,
+                    timeout_s=self.cfg.timeout_s,
+                    max_input_chars=self.cfg.max_input_chars,
+                    max_output_tokens=self.cfg.max_output_tokens,
+                    model_fast=self.cfg.openai_model_events_fast,
+                    model_accurate=self.cfg.openai_model_events_accurate,
+                )
+            except _EventSearchNotCacheable as not_cacheable:
+                return not_cacheable.result
         except Exception:
             return {
                 "suggestions": [],
@@ -1525,6 +2184,17 @@ def _format_validation_failure_hint(details: list[str]) -> str | None:
     )
 
 
+def _unique_preserve(*groups: Iterable[str]) -> list[str]:
+    """Chain ``groups`` and keep the first occurrence of each message."""
+    seen: set[str] = set()
+    unique: list[str] = []
+    for message in itertools.chain.from_iterable(groups):
+        if message not in seen:
+            seen.add(message)
+            unique.append(message)
+    return unique
+
+
 def _event_error_message_for_code(error_code: str | None) -> str | None:
     messages = {
         ERROR_CODE_MISSING_API_KEY: (
@@ -1565,52 +2235,67 @@ class ActivityOrchestrator:
 
         if on_status:
             on_status("Wetter wird geladen …")
-        weather: Optional[WeatherSummary] = None
-        if st.session_state.get("use_weather", True):
-            weather = _get_weather(criteria.date.isoformat(), self.cfg.timezone)
-
-        if st.session_state.get("offline_mode", False):
-            if on_status:
-                on_status("Offline-Bibliothek wird durchsucht …")
-            child_age_years = float(
-                st.session_state.get("profile_child_age_years", 6.0)
-            )
-            suggestions, offline_warnings = suggest_activities_offline(
-                criteria,
-                child_age_years=child_age_years,
+        # The forecast request starts right away; the offline search and the
+        # budget check run while it is in flight, and only the online event
+        # prompt (which is weather-aware) has to wait for it.
+        script_ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(
+            max_workers=1,
+            initializer=lambda: add_script_run_ctx(ctx=script_ctx),
+        ) as executor:
+            weather_future = (
+                executor.submit(
+                    _get_weather, criteria.date.isoformat(), self.cfg.timezone
+                )
+                if st.session_state.get("use_weather", True)
+                else None
             )
-            event_result = {
-                "suggestions": suggestions,
-                "sources": [],
-                "warnings": offline_warnings
-                + [
-                    "Offline-Modus aktiv: Ergebnisse stammen aus data/activity_library.json."
-                ],
-                "errors": [],
-            }
-        else:
-            if on_status:
-                on_status("Veranstaltungen werden recherchiert …")
-            if not _consume_request_budget(self.cfg, lang="DE", scope="events-search"):
+
+            if st.session_state.get("offline_mode", False):
+                if on_status:
+                    on_status("Offline-Bibliothek wird durchsucht …")
+                child_age_years = float(
+                    st.session_state.get("profile_child_age_years", 6.0)
+                )
+                suggestions, offline_warnings = suggest_activities_offline(
+                    criteria,
+                    child_age_years=child_age_years,
+                )
                 event_result = {
-                    "suggestions": [],
+                    "suggestions": suggestions,
                     "sources": [],
-                    "warnings": ["Session-Limit für API-Anfragen erreicht."],
+                    "warnings": offline_warnings
+                    + [
+                        "Offline-Modus aktiv: Ergebnisse stammen aus data/activity_library.json."
+                    ],
                     "errors": [],
                 }
             else:
-                event_result = self.openai_service.search_events(
-                    criteria, weather, mode
-                )
+                if on_status:
+                    on_status("Veranstaltungen werden recherchiert …")
+                if not _consume_request_budget(
+                    self.cfg, lang="DE", scope="events-search"
+                ):
+                    event_result = {
+                        "suggestions": [],
+                        "sources": [],
+                        "warnings": ["Session-Limit für API-Anfragen erreicht."],
+                        "errors": [],
+                    }
+                else:
+                    event_result = self.openai_service.search_events(
+                        criteria,
+                        weather_future.result() if weather_future else None,
+                        mode,
+                    )
+            weather: Optional[WeatherSummary] = (
+                weather_future.result() if weather_future else None
+            )
         event_error_code = cast(Optional[str], event_result.get("error_code"))
         event_error_hint = cast(Optional[str], event_result.get("error_hint"))
 
-        warnings.extend(cast(list[str], event_result.get("warnings", [])))
-        warnings.extend(cast(list[str], event_result.get("errors", [])))
-
-        validation_details = _extract_validation_failure_details(
-            cast(list[str], event_result.get("warnings", []))
-        )
+        event_warnings = cast(list[str], event_result.get("warnings", []))
+        validation_details = _extract_validation_failure_details(event_warnings)
         validation_hint = _format_validation_failure_hint(validation_details)
 
         class_warning = _event_error_message_for_code(event_error_code)
@@ -1626,7 +2311,11 @@ class ActivityOrchestrator:
 
         return {
             "weather": weather,
-            "warnings": list(dict.fromkeys(warnings)),
+            "warnings": _unique_preserve(
+                event_warnings,
+                cast(list[str], event_result.get("errors", [])),
+                warnings,
+            ),
             "events": event_result.get("suggestions", []),
             "sources": event_result.get("sources", []),
             "error_code": event_error_code,
@@ -1634,12 +2323,76 @@ class ActivityOrchestrator:
         }
 
 
-@st.cache_resource(show_spinner=False)
+ORCHESTRATOR_STATE_KEY = "_activity_orchestrator"
+
+
 def _get_activity_orchestrator(
     cfg: AppConfig,
 ) -> tuple[OpenAIActivityService, ActivityOrchestrator]:
+    # Per-session singleton: an identity/equality check on the frozen config is
+    # cheaper than Streamlit hashing ``cfg`` for cache_resource on every call.
+    cached = st.session_state.get(ORCHESTRATOR_STATE_KEY)
+    if cached is not None and (cached[0] is cfg or cached[0] == cfg):
+        return cached[1]
     openai_service = OpenAIActivityService(cfg=cfg)
-    return openai_service, ActivityOrchestrator(cfg=cfg, openai_service=openai_service)
+    services = (
+        openai_service,
+        ActivityOrchestrator(cfg=cfg, openai_service=openai_service),
+    )
+    st.session_state[ORCHESTRATOR_STATE_KEY] = (cfg, services)
+    return services
+
+
+EVENTS_PAYLOAD_CACHE_KEY = "events_payload_cache"
+EVENTS_PAYLOAD_CACHE_MAX_ENTRIES = 8
+EVENTS_PAYLOAD_CACHE_TTL_S = 15 * 60
+EVENTS_FORCE_REFRESH_KEY = "events_force_refresh"
+
+
+def _events_fingerprint(criteria: ActivitySearchCriteria, mode: str) -> str:
+    """Content hash of everything that shapes an events run."""
+    digest_input = orjson.dumps(
+        {
+            "criteria": criteria.model_dump(mode="json"),
+            "mode": mode,
+            "use_weather": bool(st.session_state.get("use_weather", True)),
+            "offline_mode": bool(st.session_state.get("offline_mode", False)),
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(digest_input).hexdigest()
+
+
+def _lookup_events_payload(fingerprint: str) -> Optional[dict[str, Any]]:
+    """Return the session's clean payload for ``fingerprint`` unless expired."""
+    payload_cache: dict[str, tuple[float, dict[str, Any]]] = st.session_state.get(
+        EVENTS_PAYLOAD_CACHE_KEY, {}
+    )
+    entry = payload_cache.get(fingerprint)
+    if entry is None:
+        return None
+    stored_at, payload = entry
+    if time_module.monotonic() - stored_at >= EVENTS_PAYLOAD_CACHE_TTL_S:
+        # Event listings go stale; an old entry must not mask new results.
+        payload_cache.pop(fingerprint, None)
+        return None
+    return payload
+
+
+def _store_events_payload(fingerprint: str, payload: dict[str, Any]) -> None:
+    payload_cache: dict[str, tuple[float, dict[str, Any]]] = (
+        st.session_state.setdefault(EVENTS_PAYLOAD_CACHE_KEY, {})
+    )
+    payload_cache.pop(fingerprint, None)
+    if len(payload_cache) >= EVENTS_PAYLOAD_CACHE_MAX_ENTRIES:
+        payload_cache.pop(next(iter(payload_cache)))
+    payload_cache[fingerprint] = (time_module.monotonic(), payload)
+
+
+def _clear_events_results() -> None:
+    st.session_state.pop("events_payload", None)
+    st.session_state.pop("events_fingerprint", None)
+    st.session_state.pop(EVENTS_PAYLOAD_CACHE_KEY, None)
 
 
 def render_wetter_und_events_section(
@@ -1652,12 +2405,7 @@ def render_wetter_und_events_section(
 
     with st.sidebar.form("weather_events_form", clear_on_submit=False):
         st.markdown("### " + _t(lang, "Wetter & Veranstaltungen", ""))
-        formatters = {
-            "effort": lambda value: effort_label(value, lang),
-            "topics": lambda value: theme_label(value, lang),
-            "goals": lambda goal: DOMAIN_LABELS[cast(DevelopmentDomain, goal)],
-            "available_materials": _material_label,
-        }
+        formatters = _filter_formatters(lang)
         render_filter_fields(
             _core_specs_by_id(
                 "plz",
@@ -1722,7 +2470,7 @@ def render_wetter_und_events_section(
 
         mode = st.radio(
             _t(lang, "Genauigkeit", ""),
-            options=["schnell", "genau"],
+            options=EVENT_MODE_OPTIONS,
             format_func=lambda m: (
                 _t(lang, "Schnell", "") if m == "schnell" else _t(lang, "Genau", "")
             ),
@@ -1768,34 +2516,32 @@ def render_wetter_und_events_section(
             _render_criteria_validation_error(exc, lang=lang)
             return None
 
-    def _events_fingerprint(
-        criteria_state: ActivitySearchCriteria, mode_value: str
-    ) -> str:
-        payload = {
-            "criteria": criteria_state.model_dump(mode="json"),
-            "mode": mode_value,
-        }
-        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
-        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
-
     criteria = get_criteria_state(cfg, key=CRITERIA_EVENTS_KEY)
     requested_mode = str(st.session_state.get("events_mode", mode))
     needs_refresh = bool(st.session_state.pop("weather_events_submitted", False))
+    force_refresh = bool(st.session_state.pop(EVENTS_FORCE_REFRESH_KEY, False))
 
     if needs_refresh:
-        _service, orchestrator = _get_activity_orchestrator(cfg)
+        fingerprint = _events_fingerprint(criteria, requested_mode)
         status_box = st.sidebar.empty()
+        # "Neu suchen" must really search again, so it skips the cached entry.
+        cached_payload = None if force_refresh else _lookup_events_payload(fingerprint)
+        if cached_payload is not None:
+            # Re-submitting unchanged inputs reuses the last clean result.
+            run_payload = cached_payload
+        else:
+            _service, orchestrator = _get_activity_orchestrator(cfg)
 
-        def _status_update(message: str) -> None:
-            status_box.info(message)
+            def _status_update(message: str) -> None:
+                status_box.info(message)
 
-        run_payload = orchestrator.run(
-            criteria, mode=requested_mode, on_status=_status_update
-        )
+            run_payload = orchestrator.run(
+                criteria, mode=requested_mode, on_status=_status_update
+            )
+            if run_payload.get("error_code") is None:
+                _store_events_payload(fingerprint, run_payload)
         st.session_state["events_payload"] = run_payload
-        st.session_state["events_fingerprint"] = _events_fingerprint(
-            criteria, requested_mode
-        )
+        st.session_state["events_fingerprint"] = fingerprint
         status_box.success(_t(lang, "Fertig.", ""))
 
     payload_any = st.session_state.get("events_payload")
@@ -1816,6 +2562,7 @@ def render_wetter_und_events_section(
                     )
                     st.session_state["events_mode"] = mode
                     st.session_state["weather_events_submitted"] = True
+                    st.session_state[EVENTS_FORCE_REFRESH_KEY] = True
                     st.rerun()
                 except ValidationError as exc:
                     st.sidebar.error(
@@ -1838,14 +2585,9 @@ def render_wetter_und_events_section(
                 ),
                 key="events_clear_button",
             ):
-                st.session_state.pop("events_payload", None)
-                st.session_state.pop("events_fingerprint", None)
+                _clear_events_results()
                 st.rerun()
 
-        st.session_state["events_fingerprint"] = _events_fingerprint(
-            criteria, requested_mode
-        )
-
     export_payload_any = st.session_state.get("events_payload")
     export_payload = cast(Optional[dict[str, Any]], export_payload_any)
     if export_payload is not None:
@@ -1853,9 +2595,7 @@ def render_wetter_und_events_section(
             st.markdown("### " + _t(lang, "Export", ""))
             st.download_button(
                 label=_t(lang, "JSON herunterladen", ""),
-                data=json.dumps(
-                    export_payload, ensure_ascii=False, indent=2, default=str
-                ),
+                data=partial(_events_export_json_bytes, export_payload),
                 file_name=f"wetter-events-{criteria.date.isoformat()}.json",
                 mime="application/json",
                 key="events_export_json",
@@ -1871,6 +2611,20 @@ def render_wetter_und_events_section(
     return payload
 
 
+def _events_export_json_bytes(payload: dict[str, Any]) -> bytes:
+    # Deferred to the download click; models are dumped field-wise instead of
+    # falling back to their repr.
+    weather = payload.get("weather")
+    json_payload = {
+        **payload,
+        "weather": asdict(weather) if weather else None,
+        "events": [
+            event.model_dump(mode="json") for event in payload.get("events", [])
+        ],
+    }
+    return orjson.dumps(json_payload, default=str, option=orjson.OPT_INDENT_2)
+
+
 def _events_payload_to_markdown(payload: dict[str, Any], lang: Language) -> str:
     lines = ["# Wetter & Veranstaltungen", ""]
     weather = payload.get("weather")
@@ -1885,13 +2639,13 @@ def _events_payload_to_markdown(payload: dict[str, Any], lang: Language) -> str:
         lines.append("")
 
     lines.append(f"## {_t(lang, 'Veranstaltungen', '')}")
-    events = payload.get("events", [])
+    events: list[ActivitySuggestion] = payload.get("events", [])
     if not events:
         lines.append("- Aktuell keine Treffer bei Veranstaltungen.")
-    for event in events:
-        title = str(getattr(event, "title", _t(lang, "Vorschlag", "")))
-        reason = str(getattr(event, "reason_de_en", ""))
-        lines.append(f"- {title}: {reason}")
+    fallback_title = _t(lang, "Vorschlag", "")
+    lines.extend(
+        f"- {event.title or fallback_title}: {event.reason_de_en}" for event in events
+    )
     lines.append("")
 
     sources = payload.get("sources", [])
@@ -1913,11 +2667,10 @@ def render_events_results(payload: Optional[dict[str, Any]], lang: Language) ->
     warnings = payload.get("warnings", [])
     if warnings:
         st.subheader(_t(lang, "Hinweise", ""))
-        for warning in warnings:
-            st.warning(str(warning))
+        st.warning("\n\n".join(str(warning) for warning in warnings))
 
     st.subheader(_t(lang, "Veranstaltungen", ""))
-    events = payload.get("events", [])
+    events: list[ActivitySuggestion] = payload.get("events", [])
     if not events:
         st.info(
             _t(
@@ -1926,16 +2679,39 @@ def render_events_results(payload: Optional[dict[str, Any]], lang: Language) ->
                 "",
             )
         )
-    for event in events:
-        title = str(getattr(event, "title", _t(lang, "Vorschlag", "")))
-        reason = str(getattr(event, "reason_de_en", ""))
-        st.markdown(f"- **{title}** — {reason}")
+    else:
+        # One markdown element per list keeps the delta stream at a single
+        # message instead of one per row.
+        fallback_title = _t(lang, "Vorschlag", "")
+        st.markdown(
+            "\n".join(
+                f"- **{event.title or fallback_title}** — {event.reason_de_en}"
+                for event in events
+            )
+        )
 
     sources = payload.get("sources", [])
     if sources:
         st.subheader(_t(lang, "Quellen", ""))
-        for source in sources:
-            st.markdown(f"- {source}")
+        st.markdown("\n".join(f"- {source}" for source in sources))
+
+
+def _load_adventures_and_weather(
+    criteria: ActivitySearchCriteria,
+    cfg: AppConfig,
+    *,
+    use_weather: bool,
+) -> tuple[tuple[MicroAdventure, ...], Optional[WeatherSummary]]:
+    """Load the seed adventures and, if enabled, the forecast for the day.
+
+    Both are resource/data cache hits after the first run, so they are called
+    directly; a thread pool per rerun would only add overhead.
+    """
+    adventures = _load_adventures()
+    weather = (
+        _get_weather(criteria.date.isoformat(), cfg.timezone) if use_weather else None
+    )
+    return adventures, weather
 
 
 def main() -> None:
@@ -1945,7 +2721,7 @@ def main() -> None:
         render_missing_config_ui(error)
         return
     st.session_state["cfg_max_input_chars"] = int(cfg.max_input_chars)
-    inject_custom_styles(ROOT / "Hintergrund.png")
+    inject_custom_styles(STATIC_DIR / "Hintergrund.png")
 
     default_profile = FamilyProfile(
         child_name=_profile_name_or_fallback(
@@ -1964,25 +2740,31 @@ def main() -> None:
         st.image(image="ChatGPT Image 14. Feb. 2026, 20_05_20.png", width=240)
 
     criteria, lang, family_profile = _criteria_sidebar(cfg)
-    adventures = _load_adventures()
 
     if criteria is None:
         st.warning(_t(lang, "Bitte Eingaben korrigieren.", ""))
         st.stop()
 
-    weather: Optional[WeatherSummary] = None
-    if st.session_state.get("use_weather", True):
-        weather = _get_weather(criteria.date.isoformat(), cfg.timezone)
+    adventures, weather = _load_adventures_and_weather(
+        criteria,
+        cfg,
+        use_weather=bool(st.session_state.get("use_weather", True)),
+    )
 
     criteria = criteria.model_copy(
         update={"child_age_years": float(family_profile.child_age_years)}
     )
     st.session_state[CRITERIA_DAILY_KEY] = criteria
 
-    picked, _candidates = pick_daily_adventure(adventures, criteria, weather)
-    picked = _profiled_adventure(picked, family_profile)
+    picked_slug = _daily_pick_slug(
+        adventures,
+        criteria,
+        weather,
+        cache_key=_daily_pick_cache_key(criteria, weather),
+    )
+    picked = _profiled_adventure_cached(picked_slug, family_profile)
 
-    activity_plan = _generate_activity_plan_with_retry(
+    activity_plan, plan_pending = _activity_plan_or_pending(
         cfg,
         picked,
         criteria,
@@ -1993,31 +2775,24 @@ def main() -> None:
             st.session_state.get("plan_mode", "standard"),
         ),
     )
-    activity_plan = activity_plan.model_copy(
-        update={
-            "title": _replace_family_tokens(activity_plan.title, family_profile),
-            "summary": _replace_family_tokens(activity_plan.summary, family_profile),
-            "steps": [
-                _replace_family_tokens(s, family_profile) for s in activity_plan.steps
-            ],
-            "safety_notes": [
-                _replace_family_tokens(s, family_profile)
-                for s in activity_plan.safety_notes
-            ],
-            "parent_child_prompts": [
-                _replace_family_tokens(s, family_profile)
-                for s in activity_plan.parent_child_prompts
-            ],
-            "variants": [
-                _replace_family_tokens(s, family_profile)
-                for s in activity_plan.variants
-            ],
-        }
-    )
+    activity_plan = _profiled_activity_plan(activity_plan, family_profile)
     daily_md = render_activity_plan_markdown(activity_plan)
     with st.container(border=True):
         st.subheader(_t(lang, "Abenteuer des Tages", "Adventure of the day"))
         st.markdown(f"**{picked.title}**")
+        if plan_pending:
+            with st.status(
+                _t(lang, "KI-Plan wird erstellt …", "Creating AI plan …"),
+                expanded=False,
+            ):
+                st.caption(
+                    _t(
+                        lang,
+                        "Bis dahin siehst du die Basisversion des Plans.",
+                        "Showing the basic plan until then.",
+                    )
+                )
+            st.fragment(_render_plan_status, run_every=1.0)()
         if weather:
             st.caption(
                 _t(
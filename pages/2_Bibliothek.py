@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import cast
 
+import pandas as pd
 import streamlit as st
 from pydantic import ValidationError
 
@@ -21,6 +24,7 @@ from mikroabenteuer.materials import (
     MATERIAL_LABELS,
 )
 from mikroabenteuer.models import DevelopmentDomain, MicroAdventure
+from mikroabenteuer.recommender import GOAL_SIGNALS, THEME_MATCH_TAGS
 from mikroabenteuer.settings import load_runtime_config, render_missing_config_ui
 from mikroabenteuer.ui.sidebar_nav import page_label_daily, page_label_library
 
@@ -42,6 +46,12 @@ GOAL_OPTIONS: tuple[DevelopmentDomain, ...] = (
     DevelopmentDomain.cognitive,
 )
 
+STROLLER_MODES: tuple[str, ...] = ("all", "yes", "no")
+
+PAGE_SIZE = 20
+LIBRARY_PAGE_ROWS_KEY = "library_page_rows"
+LIBRARY_FILTERS_FINGERPRINT_KEY = "library_filters_fingerprint"
+
 
 @dataclass(frozen=True)
 class LibraryFilters:
@@ -64,8 +74,75 @@ def _material_label(material_key: str) -> str:
     return MATERIAL_LABELS.get(material_key, material_key)
 
 
-def _load_adventures() -> list[MicroAdventure]:
-    return seed_adventures()
+@st.cache_resource(show_spinner=False)
+def _load_adventures() -> tuple[MicroAdventure, ...]:
+    # Shared, read-only seed data, sorted once: filtering keeps this order, so
+    # reruns neither copy nor re-sort the library. Callers must not mutate it.
+    return tuple(_sort_adventures(seed_adventures()))
+
+
+@dataclass(frozen=True)
+class _SliderBounds:
+    min_age: float
+    max_age: float
+    min_duration: int
+    max_duration: int
+    max_distance: float
+
+
+@st.cache_resource(show_spinner=False)
+def _slider_bounds() -> _SliderBounds:
+    # Filter widget ranges depend only on the static library; a resource cache
+    # outlives the re-executed page script, so the five min/max scans run once
+    # per process instead of on every rerun.
+    adventures = _load_adventures()
+    return _SliderBounds(
+        min_age=float(min(adventure.age_min for adventure in adventures)),
+        max_age=float(max(adventure.age_max for adventure in adventures)),
+        min_duration=int(min(adventure.duration_minutes for adventure in adventures)),
+        max_duration=int(max(adventure.duration_minutes for adventure in adventures)),
+        max_distance=float(max(adventure.distance_km for adventure in adventures)),
+    )
+
+
+def _summary_row(adventure: MicroAdventure) -> dict[str, object]:
+    return {
+        "title": adventure.title,
+        "area": adventure.area,
+        "duration_minutes": adventure.duration_minutes,
+        "distance_km": adventure.distance_km,
+        "energy_level": adventure.energy_level,
+        "age_range": f"{adventure.age_min}-{adventure.age_max}",
+        "stroller_ok": adventure.stroller_ok,
+        "safety_level": adventure.safety_level,
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _adventures_dataframe() -> pd.DataFrame:
+    """Overview table for the whole library, indexed by adventure slug.
+
+    A resource cache keeps it across reruns without a copy per call; callers
+    only select from it.
+    """
+    adventures = _load_adventures()
+    return pd.DataFrame.from_records(
+        [_summary_row(adventure) for adventure in adventures],
+        index=[adventure.slug for adventure in adventures],
+    )
+
+
+def _overview_column_config(lang: Language) -> dict[str, str]:
+    return {
+        "title": _t(lang, "Titel / Title", "Title / Titel"),
+        "area": _t(lang, "Gebiet / Area", "Area / Gebiet"),
+        "duration_minutes": _t(lang, "Dauer (min)", "Duration (min)"),
+        "distance_km": _t(lang, "Distanz (km)", "Distance (km)"),
+        "energy_level": _t(lang, "Aufwand / Effort", "Effort / Aufwand"),
+        "age_range": _t(lang, "Alter / Age", "Age / Alter"),
+        "stroller_ok": _t(lang, "Kinderwagen / Stroller", "Stroller / Kinderwagen"),
+        "safety_level": _t(lang, "Sicherheit / Safety", "Safety / Sicherheit"),
+    }
 
 
 def _render_preview_list(title: str, items: list[str], *, lang: Language) -> None:
@@ -126,17 +203,11 @@ def _render_adventure_card(adventure: MicroAdventure, lang: Language) -> None:
         )
 
 
-def _render_library_filters(
-    adventures: list[MicroAdventure], lang: Language
-) -> LibraryFilters:
+def _render_library_filters(lang: Language) -> LibraryFilters:
     st.markdown(
         f"**{_t(lang, 'Suche kompakt / Compact search', 'Compact search / Suche kompakt')}**"
     )
-    min_age = min(adventure.age_min for adventure in adventures)
-    max_age = max(adventure.age_max for adventure in adventures)
-    min_duration = min(adventure.duration_minutes for adventure in adventures)
-    max_duration = max(adventure.duration_minutes for adventure in adventures)
-    max_distance = max(adventure.distance_km for adventure in adventures)
+    bounds = _slider_bounds()
 
     query = st.text_input(
         _t(lang, "Freitextsuche / Text search", "Text search / Freitextsuche"),
@@ -149,7 +220,7 @@ def _render_library_filters(
     ).strip()
     effort_levels = st.multiselect(
         _t(lang, "Aufwand / Effort", "Effort / Aufwand"),
-        options=list(EFFORT_LEVELS),
+        options=EFFORT_LEVELS,
         default=[],
         format_func=lambda value: effort_label(value, lang),
     )
@@ -172,9 +243,9 @@ def _render_library_filters(
     ):
         age_range = st.slider(
             _t(lang, "Alter (Jahre) / Age (years)", "Age (years) / Alter (Jahre)"),
-            min_value=float(min_age),
-            max_value=float(max_age),
-            value=(float(min_age), float(max_age)),
+            min_value=bounds.min_age,
+            max_value=bounds.max_age,
+            value=(bounds.min_age, bounds.max_age),
             step=0.5,
         )
         duration_range = st.slider(
@@ -183,9 +254,9 @@ def _render_library_filters(
                 "Dauer (Minuten) / Duration (minutes)",
                 "Duration (minutes) / Dauer (Minuten)",
             ),
-            min_value=int(min_duration),
-            max_value=int(max_duration),
-            value=(int(min_duration), int(max_duration)),
+            min_value=bounds.min_duration,
+            max_value=bounds.max_duration,
+            value=(bounds.min_duration, bounds.max_duration),
             step=5,
         )
         max_distance_km = st.slider(
@@ -195,13 +266,13 @@ def _render_library_filters(
                 "Max distance (km) / Max. Distanz (km)",
             ),
             min_value=0.0,
-            max_value=float(max_distance),
-            value=float(max_distance),
+            max_value=bounds.max_distance,
+            value=bounds.max_distance,
             step=0.5,
         )
         stroller_mode = st.selectbox(
             _t(lang, "Kinderwagen / Stroller", "Stroller / Kinderwagen"),
-            options=["all", "yes", "no"],
+            options=STROLLER_MODES,
             index=0,
             format_func=lambda value: {
                 "all": _t(lang, "Alle / All", "All / Alle"),
@@ -228,7 +299,7 @@ def _render_library_filters(
         )
         goals = st.multiselect(
             _t(lang, "Ziele / Goals", "Goals / Ziele"),
-            options=list(GOAL_OPTIONS),
+            options=GOAL_OPTIONS,
             default=[],
             format_func=lambda goal: DOMAIN_LABELS[cast(DevelopmentDomain, goal)],
         )
@@ -252,139 +323,132 @@ def _render_library_filters(
     )
 
 
-def _matches_query(adventure: MicroAdventure, query: str) -> bool:
-    if not query:
-        return True
-    haystack = " ".join(
+@dataclass(frozen=True)
+class _AdventureSignals:
+    topics: frozenset[str]
+    benefits: frozenset[str]
+    materials_text: str
+    search_text: str
+
+
+@st.cache_resource(show_spinner=False)
+def _adventure_signals() -> dict[str, _AdventureSignals]:
+    # Tag sets and lowercased haystacks depend only on the static library, so
+    # they are built once per process instead of per adventure on every rerun.
+    return {
+        adventure.slug: _AdventureSignals(
+            topics=frozenset(
+                [
+                    *adventure.tags,
+                    *adventure.mood_tags,
+                    *adventure.weather_tags,
+                    *adventure.season_tags,
+                ]
+            ),
+            benefits=frozenset([*adventure.toddler_benefits, *adventure.tags]),
+            materials_text=" ".join(
+                adventure.packing_list + adventure.preparation
+            ).lower(),
+            search_text=" ".join(
+                [
+                    adventure.title,
+                    adventure.area,
+                    adventure.short,
+                    *adventure.tags,
+                    *adventure.mood_tags,
+                    *adventure.weather_tags,
+                ]
+            ).lower(),
+        )
+        for adventure in _load_adventures()
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _filter_frame() -> pd.DataFrame:
+    """Numeric/boolean filter columns for the whole library, indexed by slug.
+
+    Held as a resource across reruns; callers only read from it.
+    """
+    adventures = _load_adventures()
+    return pd.DataFrame.from_records(
         [
-            adventure.title,
-            adventure.area,
-            adventure.short,
-            *adventure.tags,
-            *adventure.mood_tags,
-            *adventure.weather_tags,
-        ]
-    ).lower()
-    return query.lower() in haystack
-
-
-def _matches_filters(adventure: MicroAdventure, filters: LibraryFilters) -> bool:
-    if filters.effort_levels and adventure.energy_level not in filters.effort_levels:
-        return False
-    if (
-        adventure.age_max < filters.age_range[0]
-        or adventure.age_min > filters.age_range[1]
+            {
+                "energy_level": adventure.energy_level,
+                "age_min": adventure.age_min,
+                "age_max": adventure.age_max,
+                "duration_minutes": adventure.duration_minutes,
+                "distance_km": adventure.distance_km,
+                "stroller_ok": adventure.stroller_ok,
+            }
+            for adventure in adventures
+        ],
+        index=[adventure.slug for adventure in adventures],
+    )
+
+
+def _scalar_filter_mask(frame: pd.DataFrame, filters: LibraryFilters) -> pd.Series:
+    mask = (
+        (frame["age_max"] >= filters.age_range[0])
+        & (frame["age_min"] <= filters.age_range[1])
+        & frame["duration_minutes"].between(*filters.duration_range)
+        & (frame["distance_km"] <= filters.max_distance_km)
+    )
+    if filters.effort_levels:
+        mask &= frame["energy_level"].isin(filters.effort_levels)
+    if filters.stroller_mode == "yes":
+        mask &= frame["stroller_ok"]
+    elif filters.stroller_mode == "no":
+        mask &= ~frame["stroller_ok"]
+    return mask
+
+
+def _matches_signals(adventure: MicroAdventure, filters: LibraryFilters) -> bool:
+    signals = _adventure_signals()[adventure.slug]
+    if filters.topics and not any(
+        any(signal in signals.topics for signal in THEME_MATCH_TAGS.get(topic, {topic}))
+        for topic in filters.topics
     ):
         return False
-    if not (
-        filters.duration_range[0]
-        <= adventure.duration_minutes
-        <= filters.duration_range[1]
+    if filters.goals and not any(
+        any(
+            signal in signals.benefits
+            for signal in GOAL_SIGNALS.get(goal, {goal.value})
+        )
+        for goal in filters.goals
     ):
         return False
-    if adventure.distance_km > filters.max_distance_km:
-        return False
-    if filters.stroller_mode == "yes" and not adventure.stroller_ok:
-        return False
-    if filters.stroller_mode == "no" and adventure.stroller_ok:
-        return False
-    if filters.topics:
-        adventure_signals = (
-            set(adventure.tags)
-            | set(adventure.mood_tags)
-            | set(adventure.weather_tags)
-            | set(adventure.season_tags)
+    if filters.available_materials and not all(
+        any(
+            alias in signals.materials_text
+            for alias in MATERIAL_ALIASES.get(material, (material,))
         )
-        topic_match_map: dict[str, set[str]] = {
-            "nature": {"Natur"},
-            "movement": {"Bewegung", "Motorik", "Abenteuer"},
-            "creative": {"Kreativ", "Musik", "Sprache"},
-            "learning": {"Lernen"},
-            "mindfulness": {"Achtsamkeit", "Ruhig"},
-            "social": {"Sozial", "Werte", "Bonding", "Alltag"},
-            "water": {"Wasser"},
-            "rain": {"Regen"},
-            "wind": {"Wind"},
-            "winter": {"Winter"},
-            "evening": {"Abend"},
-            "playground": {"Spielplatz"},
-        }
-        if not any(
-            any(
-                signal in adventure_signals
-                for signal in topic_match_map.get(topic, {topic})
-            )
-            for topic in filters.topics
-        ):
-            return False
-    if filters.goals:
-        goal_signal_map: dict[DevelopmentDomain, set[str]] = {
-            DevelopmentDomain.gross_motor: {
-                "Grobmotorik",
-                "Bewegung",
-                "Koordination",
-                "Körpergefühl",
-            },
-            DevelopmentDomain.fine_motor: {
-                "Feinmotorik",
-                "Hand-Auge",
-                "Greifen",
-                "Sortieren",
-            },
-            DevelopmentDomain.language: {
-                "Sprache",
-                "Wortschatz",
-                "Erzählen",
-                "Hypothesen",
-            },
-            DevelopmentDomain.social_emotional: {
-                "Empathie",
-                "Teamwork",
-                "Sozial",
-                "Respekt",
-                "Bindung",
-            },
-            DevelopmentDomain.sensory: {"Sensorik", "Achtsamkeit", "Wahrnehmung"},
-            DevelopmentDomain.cognitive: {
-                "Kategorisieren",
-                "Gedächtnis",
-                "Vergleich",
-                "Ursache/Wirkung",
-            },
-        }
-        benefit_signals = set(adventure.toddler_benefits) | set(adventure.tags)
-        if not any(
-            any(
-                signal in benefit_signals
-                for signal in goal_signal_map.get(goal, {goal.value})
-            )
-            for goal in filters.goals
-        ):
-            return False
-    if filters.available_materials:
-        haystack = " ".join(adventure.packing_list + adventure.preparation).lower()
-        if not all(
-            any(
-                alias in haystack
-                for alias in MATERIAL_ALIASES.get(material, (material,))
-            )
-            for material in filters.available_materials
-        ):
-            return False
-    if not _matches_query(adventure, filters.query):
+        for material in filters.available_materials
+    ):
         return False
-    return True
+    return not filters.query or filters.query.lower() in signals.search_text
 
 
 def _filter_adventures(
-    adventures: list[MicroAdventure], filters: LibraryFilters
+    adventures: Sequence[MicroAdventure], filters: LibraryFilters
 ) -> list[MicroAdventure]:
+    # Range/flag filters run as one vectorized mask; only the survivors go
+    # through the tag, material and text checks.
+    frame = _filter_frame()
+    candidates = set(frame.index[_scalar_filter_mask(frame, filters)])
     return [
-        adventure for adventure in adventures if _matches_filters(adventure, filters)
+        adventure
+        for adventure in adventures
+        if adventure.slug in candidates and _matches_signals(adventure, filters)
     ]
 
 
-def _sort_adventures(adventures: list[MicroAdventure]) -> list[MicroAdventure]:
+def _filters_fingerprint(filters: LibraryFilters) -> str:
+    # The dataclass repr covers every filter value, enums included.
+    return hashlib.sha256(repr(filters).encode("utf-8")).hexdigest()[:16]
+
+
+def _sort_adventures(adventures: Sequence[MicroAdventure]) -> list[MicroAdventure]:
     return sorted(
         adventures,
         key=lambda adventure: (
@@ -395,6 +459,12 @@ def _sort_adventures(adventures: list[MicroAdventure]) -> list[MicroAdventure]:
     )
 
 
+def _show_more_rows() -> None:
+    st.session_state[LIBRARY_PAGE_ROWS_KEY] = (
+        int(st.session_state.get(LIBRARY_PAGE_ROWS_KEY, PAGE_SIZE)) + PAGE_SIZE
+    )
+
+
 def main() -> None:
     try:
         _cfg: AppConfig = load_runtime_config()
@@ -412,8 +482,13 @@ def main() -> None:
     st.title("Bibliothek / Library")
 
     adventures = _load_adventures()
-    filters = _render_library_filters(adventures, lang)
-    filtered = _sort_adventures(_filter_adventures(adventures, filters))
+    filters = _render_library_filters(lang)
+    filters_fingerprint = _filters_fingerprint(filters)
+    if st.session_state.get(LIBRARY_FILTERS_FINGERPRINT_KEY) != filters_fingerprint:
+        # A new result opens on its first page again, not at the grown count.
+        st.session_state[LIBRARY_FILTERS_FINGERPRINT_KEY] = filters_fingerprint
+        st.session_state[LIBRARY_PAGE_ROWS_KEY] = PAGE_SIZE
+    filtered = _filter_adventures(adventures, filters)
 
     st.caption(
         _t(
@@ -432,8 +507,40 @@ def main() -> None:
         )
         return
 
-    for adventure in filtered:
-        _render_adventure_card(adventure, lang)
+    # The table grows in pages; a rerun only serializes the rows shown so far.
+    visible_count = int(st.session_state.setdefault(LIBRARY_PAGE_ROWS_KEY, PAGE_SIZE))
+    visible = filtered[:visible_count]
+    event = st.dataframe(
+        _adventures_dataframe().loc[[adventure.slug for adventure in visible]],
+        column_config=_overview_column_config(lang),
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        # Keyed per filter state: Streamlit keeps a keyed table's selected row
+        # index across data changes, which would point at another adventure.
+        key=f"library_overview_{filters_fingerprint}",
+    )
+
+    if visible_count < len(filtered):
+        st.button(
+            _t(lang, "Mehr anzeigen / Show more", "Show more / Mehr anzeigen"),
+            on_click=_show_more_rows,
+            key="library_show_more",
+        )
+
+    # Only the selected adventure is rendered in detail.
+    selected_rows = [row for row in event.selection.rows if row < len(visible)]
+    if not selected_rows:
+        st.caption(
+            _t(
+                lang,
+                "Zeile auswählen, um Details zu sehen. / Select a row to see details.",
+                "Select a row to see details. / Zeile auswählen, um Details zu sehen.",
+            )
+        )
+        return
+
+    _render_adventure_card(visible[selected_rows[0]], lang)
 
 
 if __name__ == "__main__":
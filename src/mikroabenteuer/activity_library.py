@@ -34,8 +34,9 @@ def _activity_library_path() -> Path:
 
 
 @lru_cache(maxsize=1)
-def load_activity_library() -> list[ActivityLibraryItem]:
-    data_path = _activity_library_path()
+def _load_activity_library_snapshot(
+    data_path: Path, mtime_ns: int
+) -> list[ActivityLibraryItem]:
     raw_payload = json.loads(data_path.read_text(encoding="utf-8"))
     items_raw = (
         raw_payload.get("activities", []) if isinstance(raw_payload, dict) else []
@@ -43,6 +44,13 @@ def load_activity_library() -> list[ActivityLibraryItem]:
     return [ActivityLibraryItem.model_validate(item) for item in items_raw]
 
 
+def load_activity_library() -> list[ActivityLibraryItem]:
+    # Keyed on the file's mtime: steady-state calls are a stat() plus a cache
+    # hit, while edits to the JSON file are picked up without a restart.
+    data_path = _activity_library_path()
+    return _load_activity_library_snapshot(data_path, data_path.stat().st_mtime_ns)
+
+
 def _score_item(
     item: ActivityLibraryItem,
     criteria: ActivitySearchCriteria,
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure breaker.
+
+    After ``threshold`` failed attempts in a row the breaker reports open for
+    ``cooldown_s`` seconds after the latest failure; one success closes it.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.failures = 0
+        self.opened_at = 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def is_open(self, *, threshold: int, cooldown_s: float) -> bool:
+        now = self._clock()
+        with self._lock:
+            return self.failures >= threshold and now - self.opened_at < cooldown_s
+
+    def record(self, *, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self.failures = 0
+            else:
+                self.failures += 1
+                self.opened_at = self._clock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = 0.0
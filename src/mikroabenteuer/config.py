@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
 from .constants import DEFAULT_AREA, DEFAULT_CITY, DEFAULT_TIMEZONE
 
@@ -54,6 +55,19 @@ class AppConfig:
     max_output_tokens: int
     timeout_s: float
     max_requests_per_session: int
+    plan_retry_max_attempts: int
+    plan_retry_base_delay_s: float
+    plan_retry_max_delay_s: float
+    plan_retry_jitter: float
+    plan_breaker_threshold: int
+    plan_breaker_cooldown_s: float
+    events_breaker_threshold: int
+    events_breaker_cooldown_s: float
+    # Optional deployment-wide budget (SQLite token bucket, one bucket per API
+    # key shared by all sessions and processes on the file); empty path = off.
+    shared_budget_path: str
+    shared_budget_capacity: int
+    shared_budget_refill_per_hour: float
 
     # Optional: Google integration (only used if you wire it up)
     google_client_secrets_file: str
@@ -91,6 +105,29 @@ def load_config() -> AppConfig:
         max_requests_per_session=max(
             1, int(os.getenv("MAX_REQUESTS_PER_SESSION", "10"))
         ),
+        plan_retry_max_attempts=max(1, int(os.getenv("PLAN_RETRY_MAX_ATTEMPTS", "5"))),
+        plan_retry_base_delay_s=max(
+            0.0, float(os.getenv("PLAN_RETRY_BASE_DELAY_S", "0.5"))
+        ),
+        plan_retry_max_delay_s=max(
+            0.0, float(os.getenv("PLAN_RETRY_MAX_DELAY_S", "8"))
+        ),
+        plan_retry_jitter=max(0.0, float(os.getenv("PLAN_RETRY_JITTER", "0.5"))),
+        plan_breaker_threshold=max(1, int(os.getenv("PLAN_BREAKER_THRESHOLD", "3"))),
+        plan_breaker_cooldown_s=max(
+            0.0, float(os.getenv("PLAN_BREAKER_COOLDOWN_S", "30"))
+        ),
+        events_breaker_threshold=max(
+            1, int(os.getenv("EVENTS_BREAKER_THRESHOLD", "3"))
+        ),
+        events_breaker_cooldown_s=max(
+            0.0, float(os.getenv("EVENTS_BREAKER_COOLDOWN_S", "60"))
+        ),
+        shared_budget_path=os.getenv("SHARED_BUDGET_PATH", "").strip(),
+        shared_budget_capacity=max(1, int(os.getenv("SHARED_BUDGET_CAPACITY", "10"))),
+        shared_budget_refill_per_hour=max(
+            0.0, float(os.getenv("SHARED_BUDGET_REFILL_PER_HOUR", "10"))
+        ),
         google_client_secrets_file=os.getenv(
             "GOOGLE_OAUTH_CLIENT_SECRETS_FILE", "client_secret.json"
         ),
@@ -99,3 +136,10 @@ def load_config() -> AppConfig:
         gmail_to_email=os.getenv("GMAIL_TO_EMAIL", ""),
         calendar_id=os.getenv("CALENDAR_ID", ""),
     )
+
+
+@lru_cache(maxsize=4)
+def offline_config(cfg: AppConfig) -> AppConfig:
+    # AppConfig is frozen and hashable; living in a package module, the
+    # LLM-disabled copy is built once per config and process, not per rerun.
+    return replace(cfg, enable_llm=False)
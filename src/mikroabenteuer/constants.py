@@ -56,22 +56,26 @@ THEMES: List[Theme] = [
 ]
 
 
-def theme_options(lang: Language) -> List[str]:
+# Precomputed lookups; the UI calls these helpers on every Streamlit rerun.
+THEME_KEYS: Tuple[str, ...] = tuple(t.key for t in THEMES)
+_THEMES_BY_KEY: Dict[str, Theme] = {t.key: t for t in THEMES}
+EFFORT_INDEX: Dict[str, int] = {key: idx for idx, key in enumerate(EFFORT_LEVELS)}
+_EFFORT_LABELS: Dict[str, Dict[Language, str]] = {
+    "niedrig": {"DE": "niedrig", "EN": "low (easy)"},
+    "mittel": {"DE": "mittel", "EN": "medium (normal)"},
+    "hoch": {"DE": "hoch", "EN": "high (sporty)"},
+}
+
+
+def theme_options(lang: Language) -> Tuple[str, ...]:
     """Return theme keys in stable order."""
-    return [t.key for t in THEMES]
+    return THEME_KEYS
 
 
 def theme_label(theme_key: str, lang: Language) -> str:
-    for t in THEMES:
-        if t.key == theme_key:
-            return t.labels[lang]
-    return theme_key
+    theme = _THEMES_BY_KEY.get(theme_key)
+    return theme.labels[lang] if theme else theme_key
 
 
 def effort_label(effort_key: str, lang: Language) -> str:
-    labels = {
-        "niedrig": {"DE": "niedrig", "EN": "low (easy)"},
-        "mittel": {"DE": "mittel", "EN": "medium (normal)"},
-        "hoch": {"DE": "hoch", "EN": "high (sporty)"},
-    }
-    return labels.get(effort_key, {}).get(lang, effort_key)
+    return _EFFORT_LABELS.get(effort_key, {}).get(lang, effort_key)
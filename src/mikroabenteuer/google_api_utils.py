@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import random
 import time
 from collections.abc import Callable
 from typing import TypeVar
@@ -10,8 +11,18 @@ T = TypeVar("T")
 LOGGER = logging.getLogger(__name__)
 
 
+def _is_retryable_status(status: int) -> bool:
+    # Quota (429) and server errors are transient; other 4xx responses fail
+    # the same way on every attempt.
+    return status == 429 or status >= 500
+
+
 def safe_api_call(func: Callable[[], T], retries: int = 3) -> T:
-    """Execute API call with exponential backoff on transient Google HTTP errors."""
+    """Execute API call with exponential backoff on transient Google HTTP errors.
+
+    Only 429 and 5xx responses are retried; the jitter keeps concurrent
+    callers from retrying in lockstep against the same quota.
+    """
     from googleapiclient.errors import HttpError
 
     for attempt in range(retries):
@@ -19,8 +30,10 @@ def safe_api_call(func: Callable[[], T], retries: int = 3) -> T:
             return func()
         except HttpError as error:
             LOGGER.error("Google API request failed: %s", error)
-            if attempt >= retries - 1:
+            status = int(getattr(error.resp, "status", 500))
+            if attempt >= retries - 1 or not _is_retryable_status(status):
                 raise
-            time.sleep(2**attempt)
+            delay = 2**attempt
+            time.sleep(delay + random.uniform(0, 0.5 * delay))
 
     raise RuntimeError("Unexpected retry loop termination")
@@ -3,13 +3,23 @@ from __future__ import annotations
 from datetime import date, datetime, time, timedelta, timezone
 from uuid import uuid4
 
+# RFC 5545 TEXT escaping in a single pass; the table maps each character
+# independently, so backslashes added here are never escaped twice.
+_ICS_ESCAPE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+
 
 def _escape_ics(text: str) -> str:
+    return text.translate(_ICS_ESCAPE)
+
+
+def _ics_date(day: date) -> str:
+    # Plain field formatting; strftime goes through the C locale machinery.
+    return f"{day.year:04d}{day.month:02d}{day.day:02d}"
+
+
+def _ics_datetime(moment: datetime) -> str:
     return (
-        text.replace("\\", "\\\\")
-        .replace(";", "\\;")
-        .replace(",", "\\,")
-        .replace("\n", "\\n")
+        f"{_ics_date(moment)}T{moment.hour:02d}{moment.minute:02d}{moment.second:02d}"
     )
 
 
@@ -24,30 +34,34 @@ def build_ics_event(
     duration_minutes: int = 60,
 ) -> bytes:
     uid = f"{uuid4()}@mikroabenteuer.local"
-    dtstamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//Miris Mikroabenteuer//DE",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-        "BEGIN:VEVENT",
-        f"UID:{uid}",
-        f"DTSTAMP:{dtstamp}",
-        f"SUMMARY:{_escape_ics(summary)}",
-        f"DESCRIPTION:{_escape_ics(description)}",
-        f"LOCATION:{_escape_ics(location)}",
-    ]
+    dtstamp = _ics_datetime(datetime.now(tz=timezone.utc)) + "Z"
 
     if start_time_local is None:
-        lines.append(f"DTSTART;VALUE=DATE:{day.strftime('%Y%m%d')}")
-        lines.append(f"DTEND;VALUE=DATE:{(day + timedelta(days=1)).strftime('%Y%m%d')}")
+        dtstart = f"DTSTART;VALUE=DATE:{_ics_date(day)}"
+        dtend = f"DTEND;VALUE=DATE:{_ics_date(day + timedelta(days=1))}"
     else:
         start_local = datetime.combine(day, start_time_local)
         end_local = start_local + timedelta(minutes=max(15, duration_minutes))
-        lines.append(f"DTSTART;TZID={tzid}:{start_local.strftime('%Y%m%dT%H%M%S')}")
-        lines.append(f"DTEND;TZID={tzid}:{end_local.strftime('%Y%m%dT%H%M%S')}")
+        dtstart = f"DTSTART;TZID={tzid}:{_ics_datetime(start_local)}"
+        dtend = f"DTEND;TZID={tzid}:{_ics_datetime(end_local)}"
 
-    lines.extend(["END:VEVENT", "END:VCALENDAR", ""])
-    return "\r\n".join(lines).encode("utf-8")
+    return "\r\n".join(
+        (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//Miris Mikroabenteuer//DE",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            "BEGIN:VEVENT",
+            f"UID:{uid}",
+            f"DTSTAMP:{dtstamp}",
+            f"SUMMARY:{_escape_ics(summary)}",
+            f"DESCRIPTION:{_escape_ics(description)}",
+            f"LOCATION:{_escape_ics(location)}",
+            dtstart,
+            dtend,
+            "END:VEVENT",
+            "END:VCALENDAR",
+            "",
+        )
+    ).encode("utf-8")
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from datetime import date as dt_date, datetime, time
+from datetime import date as dt_date, time
 from enum import Enum
 from typing import Annotated, List, Literal
 from urllib.parse import urlparse, urlunparse
@@ -344,9 +344,14 @@ class ActivitySearchCriteria(BaseModel):
 
     @property
     def available_minutes(self) -> int:
-        start_dt = datetime.combine(self.date, self.time_window.start)
-        end_dt = datetime.combine(self.date, self.time_window.end)
-        return int((end_dt - start_dt).total_seconds() // 60)
+        # Plain clock arithmetic; TimeWindow guarantees end > start on one day.
+        start, end = self.time_window.start, self.time_window.end
+        seconds = (
+            (end.hour - start.hour) * 3600
+            + (end.minute - start.minute) * 60
+            + (end.second - start.second)
+        )
+        return seconds // 60
 
     def to_llm_params(self) -> dict[str, str | float | int | List[str]]:
         return {
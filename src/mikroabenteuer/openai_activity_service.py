@@ -630,10 +630,13 @@ def suggest_activities(
         return parsed
 
     try:
+        # Fast failures (429/5xx, dropped connections) are retried, but a call
+        # that already used up the timeout is not repeated on the same rerun.
         return retry_with_backoff(
             max_attempts=3,
             base_delay=0.5,
             should_retry=_is_retryable_openai_error,
+            deadline_s=timeout_s,
         )(_call_openai)()
     except ValidationError as exc:
         safe_issues = _safe_validation_issue_metadata(exc)
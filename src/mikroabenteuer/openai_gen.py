@@ -1,6 +1,7 @@
 # src/mikroabenteuer/openai_gen.py
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any, Literal, Optional, cast
 
 from pydantic import ValidationError
@@ -501,8 +502,8 @@ def generate_activity_plan(
     payload = {
         "activity_request": activity_request.model_dump(mode="json"),
         "criteria": criteria.model_dump(mode="json"),
-        "weather": weather.__dict__ if weather else None,
-        "adventure_seed": adventure.__dict__,
+        "weather": asdict(weather) if weather else None,
+        "adventure_seed": asdict(adventure),
     }
 
     tools = [{"type": "web_search"}] if cfg.enable_web_search else []
@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .models import ActivityPlan
 
 
@@ -58,8 +60,8 @@ def save_plan_report(plan: ActivityPlan, reason: str) -> PlanReport:
         "plan_hash": report.plan_hash,
         "reason": report.reason,
     }
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+    with path.open("ab") as handle:
+        handle.write(orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE))
 
     return report
 
@@ -70,12 +72,12 @@ def load_plan_reports(limit: int = 50) -> list[dict[str, Any]]:
         return []
 
     rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         for line in handle:
             stripped = line.strip()
             if not stripped:
                 continue
-            rows.append(cast_report_json(json.loads(stripped)))
+            rows.append(cast_report_json(orjson.loads(stripped)))
 
     return rows[-max(0, limit) :][::-1]
 
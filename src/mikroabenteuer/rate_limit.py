@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+
+def credential_bucket_key(api_key: str | None, *, scope: str = "openai") -> str:
+    """Stable bucket key per credential; only a short hash is ever persisted."""
+    digest = hashlib.sha256((api_key or "anonymous").encode("utf-8")).hexdigest()
+    return f"{scope}:{digest[:16]}"
+
+
+class TokenBucket:
+    """Token bucket persisted in SQLite.
+
+    All Streamlit sessions (tabs) of a process, and processes sharing the same
+    file, draw from one budget: ``tokens`` refill continuously at
+    ``refill_per_s`` up to ``capacity``. Updates run inside ``BEGIN IMMEDIATE``
+    so concurrent consumers cannot both take the last token.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        capacity: float,
+        refill_per_s: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if refill_per_s < 0:
+            raise ValueError("refill_per_s must be >= 0")
+        self.path = path
+        self.capacity = float(capacity)
+        self.refill_per_s = float(refill_per_s)
+        self._clock = clock
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, last_refill REAL NOT NULL)"
+        )
+        return conn
+
+    def try_consume(self, key: str, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` from the bucket for ``key`` if enough are available."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = self._clock()
+            row = conn.execute(
+                "SELECT tokens, last_refill FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                available = self.capacity
+            else:
+                stored, last_refill = row
+                elapsed = max(0.0, now - last_refill)
+                available = min(self.capacity, stored + elapsed * self.refill_per_s)
+
+            allowed = available >= tokens
+            if allowed:
+                available -= tokens
+            conn.execute(
+                "INSERT INTO buckets (key, tokens, last_refill) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "tokens = excluded.tokens, last_refill = excluded.last_refill",
+                (key, available, now),
+            )
+            conn.execute("COMMIT")
+            return allowed
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
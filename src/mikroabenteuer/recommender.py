@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import hashlib
 import random
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from .constants import THEMES
 from .models import ActivitySearchCriteria, DevelopmentDomain, MicroAdventure
@@ -16,41 +16,51 @@ def _seed_int(*parts: str) -> int:
     return int(h[:16], 16)
 
 
-def _theme_match_tags(theme_key: str) -> List[str]:
-    for t in THEMES:
-        if t.key == theme_key:
-            return t.match_tags
-    return []
+THEME_MATCH_TAGS: dict[str, frozenset[str]] = {
+    t.key: frozenset(t.match_tags) for t in THEMES
+}
+
+
+def _theme_match_tags(theme_key: str) -> frozenset[str]:
+    return THEME_MATCH_TAGS.get(theme_key, frozenset())
+
+
+def _wanted_topic_tags(topics: List[str]) -> frozenset[str]:
+    # "Any topic matches" == "the union of all wanted tags intersects".
+    return frozenset().union(*(_theme_match_tags(topic) for topic in topics))
+
+
+def _topic_signals(adventure: MicroAdventure) -> set[str]:
+    return {
+        *adventure.tags,
+        *adventure.weather_tags,
+        *adventure.mood_tags,
+        *adventure.season_tags,
+    }
 
 
 def matches_topics(adventure: MicroAdventure, topics: List[str]) -> bool:
     if not topics:
         return True
-    adv_signals = (
-        set(adventure.tags)
-        | set(adventure.weather_tags)
-        | set(adventure.mood_tags)
-        | set(adventure.season_tags)
-    )
-    for topic_key in topics:
-        wanted = _theme_match_tags(topic_key)
-        if any(tag in adv_signals for tag in wanted):
-            return True
-    return False
+    return not _wanted_topic_tags(topics).isdisjoint(_topic_signals(adventure))
 
 
 def filter_adventures(
-    adventures: List[MicroAdventure],
+    adventures: Sequence[MicroAdventure],
     criteria: ActivitySearchCriteria,
 ) -> List[MicroAdventure]:
+    # Criteria-derived values are computed once, not once per adventure.
+    available_minutes = criteria.available_minutes
+    child_age_years = criteria.child_age_years
+    wanted_tags = _wanted_topic_tags(criteria.topics) if criteria.topics else None
     results: List[MicroAdventure] = []
     for a in adventures:
         # time filter
-        if a.duration_minutes > criteria.available_minutes:
+        if a.duration_minutes > available_minutes:
             continue
 
         # age filter
-        if criteria.child_age_years < a.age_min or criteria.child_age_years > a.age_max:
+        if child_age_years < a.age_min or child_age_years > a.age_max:
             continue
 
         # effort filter: gentle gating
@@ -64,44 +74,56 @@ def filter_adventures(
                 continue
 
         # topics
-        if not matches_topics(a, criteria.topics):
+        if wanted_tags is not None and wanted_tags.isdisjoint(_topic_signals(a)):
             continue
 
         results.append(a)
     return results
 
 
-def _goal_signals(goal: DevelopmentDomain) -> set[str]:
-    signals: dict[DevelopmentDomain, set[str]] = {
-        DevelopmentDomain.gross_motor: {
+GOAL_SIGNALS: dict[DevelopmentDomain, frozenset[str]] = {
+    DevelopmentDomain.gross_motor: frozenset(
+        {
             "Grobmotorik",
             "Bewegung",
             "Koordination",
             "Körpergefühl",
-        },
-        DevelopmentDomain.fine_motor: {
+        }
+    ),
+    DevelopmentDomain.fine_motor: frozenset(
+        {
             "Feinmotorik",
             "Hand-Auge",
             "Greifen",
             "Sortieren",
-        },
-        DevelopmentDomain.language: {"Sprache", "Wortschatz", "Erzählen", "Hypothesen"},
-        DevelopmentDomain.social_emotional: {
+        }
+    ),
+    DevelopmentDomain.language: frozenset(
+        {"Sprache", "Wortschatz", "Erzählen", "Hypothesen"}
+    ),
+    DevelopmentDomain.social_emotional: frozenset(
+        {
             "Empathie",
             "Teamwork",
             "Sozial",
             "Respekt",
             "Bindung",
-        },
-        DevelopmentDomain.sensory: {"Sensorik", "Achtsamkeit", "Wahrnehmung"},
-        DevelopmentDomain.cognitive: {
+        }
+    ),
+    DevelopmentDomain.sensory: frozenset({"Sensorik", "Achtsamkeit", "Wahrnehmung"}),
+    DevelopmentDomain.cognitive: frozenset(
+        {
             "Kategorisieren",
             "Gedächtnis",
             "Vergleich",
             "Ursache/Wirkung",
-        },
-    }
-    return signals[goal]
+        }
+    ),
+}
+
+
+def _goal_signals(goal: DevelopmentDomain) -> frozenset[str]:
+    return GOAL_SIGNALS[goal]
 
 
 def score_adventure(
@@ -117,15 +139,9 @@ def score_adventure(
 
     # Themes -> score boost per match
     if criteria.topics:
-        adv_signals = (
-            set(adventure.tags)
-            | set(adventure.weather_tags)
-            | set(adventure.mood_tags)
-            | set(adventure.season_tags)
-        )
+        adv_signals = _topic_signals(adventure)
         for topic_key in criteria.topics:
-            wanted = _theme_match_tags(topic_key)
-            if any(tag in adv_signals for tag in wanted):
+            if not _theme_match_tags(topic_key).isdisjoint(adv_signals):
                 score += 1.0
 
     # Weather -> prefer matching weather_tags
@@ -150,12 +166,15 @@ def score_adventure(
             score += 0.25
 
     # goal alignment
-    benefit_signals = (
-        set(adventure.toddler_benefits) | set(adventure.tags) | set(adventure.mood_tags)
-    )
-    for goal in criteria.goals:
-        if any(signal in benefit_signals for signal in _goal_signals(goal)):
-            score += 1.0
+    if criteria.goals:
+        benefit_signals = {
+            *adventure.toddler_benefits,
+            *adventure.tags,
+            *adventure.mood_tags,
+        }
+        for goal in criteria.goals:
+            if not _goal_signals(goal).isdisjoint(benefit_signals):
+                score += 1.0
 
     # safety preference (implicit: lower safety_level is easier with toddlers)
     if adventure.safety_level == "niedrig":
@@ -165,7 +184,7 @@ def score_adventure(
 
 
 def pick_daily_adventure(
-    adventures: List[MicroAdventure],
+    adventures: Sequence[MicroAdventure],
     criteria: ActivitySearchCriteria,
     weather: Optional[WeatherSummary] = None,
 ) -> Tuple[MicroAdventure, List[MicroAdventure]]:
@@ -175,7 +194,7 @@ def pick_daily_adventure(
     """
     candidates = filter_adventures(adventures, criteria)
     if not candidates:
-        candidates = adventures[:]  # fallback: don't block the day
+        candidates = list(adventures)  # fallback: don't block the day
 
     scored = [(a, score_adventure(a, criteria, weather)) for a in candidates]
     scored.sort(key=lambda x: x[1], reverse=True)
@@ -13,22 +13,28 @@ def retry_with_backoff(
     max_attempts: int,
     base_delay: float,
     should_retry: Callable[[Exception], bool] | None = None,
+    deadline_s: float | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Retry function with exponential backoff.
 
     The wrapped function is called up to ``max_attempts`` times.
     Delay grows as ``base_delay * (2 ** attempt_index)``.
+    With ``deadline_s``, no further attempt starts once the elapsed time plus
+    the next delay would exceed it, so slow failures are not repeated.
     """
 
     if max_attempts < 1:
         raise ValueError("max_attempts must be >= 1")
     if base_delay < 0:
         raise ValueError("base_delay must be >= 0")
+    if deadline_s is not None and deadline_s <= 0:
+        raise ValueError("deadline_s must be > 0")
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             last_error: Exception | None = None
+            started = time.monotonic()
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
@@ -40,6 +46,11 @@ def retry_with_backoff(
                     if attempt == max_attempts - 1:
                         break
                     sleep_for = base_delay * (2**attempt)
+                    if (
+                        deadline_s is not None
+                        and time.monotonic() - started + sleep_for > deadline_s
+                    ):
+                        break
                     if sleep_for > 0:
                         time.sleep(sleep_for)
 
@@ -44,6 +44,17 @@ class RuntimeSettings(BaseSettings):
     max_output_tokens: int = 1400
     timeout_s: float = 45.0
     max_requests_per_session: int = 10
+    plan_retry_max_attempts: int = 5
+    plan_retry_base_delay_s: float = 0.5
+    plan_retry_max_delay_s: float = 8.0
+    plan_retry_jitter: float = 0.5
+    plan_breaker_threshold: int = 3
+    plan_breaker_cooldown_s: float = 30.0
+    events_breaker_threshold: int = 3
+    events_breaker_cooldown_s: float = 60.0
+    shared_budget_path: str = ""
+    shared_budget_capacity: int = 10
+    shared_budget_refill_per_hour: float = 10.0
 
     google_client_secrets_file: str = "client_secret.json"
     google_token_file: str = "token.json"
@@ -109,6 +120,19 @@ class RuntimeSettings(BaseSettings):
         self.max_output_tokens = max(100, self.max_output_tokens)
         self.timeout_s = max(5.0, self.timeout_s)
         self.max_requests_per_session = max(1, self.max_requests_per_session)
+        self.plan_retry_max_attempts = max(1, self.plan_retry_max_attempts)
+        self.plan_retry_base_delay_s = max(0.0, self.plan_retry_base_delay_s)
+        self.plan_retry_max_delay_s = max(0.0, self.plan_retry_max_delay_s)
+        self.plan_retry_jitter = max(0.0, self.plan_retry_jitter)
+        self.plan_breaker_threshold = max(1, self.plan_breaker_threshold)
+        self.plan_breaker_cooldown_s = max(0.0, self.plan_breaker_cooldown_s)
+        self.events_breaker_threshold = max(1, self.events_breaker_threshold)
+        self.events_breaker_cooldown_s = max(0.0, self.events_breaker_cooldown_s)
+        self.shared_budget_path = self.shared_budget_path.strip()
+        self.shared_budget_capacity = max(1, self.shared_budget_capacity)
+        self.shared_budget_refill_per_hour = max(
+            0.0, self.shared_budget_refill_per_hour
+        )
         return self
 
     def to_app_config(self) -> AppConfig:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from functools import lru_cache
+from typing import Any, Literal
 
 CriteriaNamespace = Literal["daily", "events"]
 
@@ -21,3 +22,45 @@ class CriteriaKeySpace:
 
     def widget(self, field: str) -> str:
         return f"{self.session_prefix}_{field}"
+
+
+CRITERIA_WIDGET_FIELDS: tuple[str, ...] = (
+    "plz",
+    "radius_km",
+    "date",
+    "start_time",
+    "available_minutes",
+    "effort",
+    "budget_eur_max",
+    "child_age_years",
+    "topics",
+    "location_preference",
+    "goals",
+    "constraints",
+    "available_materials",
+)
+
+_OPTIONAL_WIDGET_DEFAULTS: dict[CriteriaNamespace, dict[str, Any]] = {
+    "daily": {"constraints_optional": "", "extra_context": ""},
+    "events": {
+        "constraints_optional": "",
+        "extra_context": "",
+        "pref_outdoor": False,
+        "pref_indoor": False,
+    },
+}
+
+
+@lru_cache(maxsize=2)
+def widget_key_pairs(
+    namespace: CriteriaNamespace,
+) -> tuple[tuple[tuple[str, str], ...], tuple[tuple[str, str, Any], ...]]:
+    # Session keys are fixed per namespace; as a package-level memo the
+    # f-strings are built once per process instead of on every rerun.
+    keys = CriteriaKeySpace(namespace)
+    required = tuple((field, keys.widget(field)) for field in CRITERIA_WIDGET_FIELDS)
+    optional = tuple(
+        (field, keys.widget(field), default)
+        for field, default in _OPTIONAL_WIDGET_DEFAULTS[namespace].items()
+    )
+    return required, optional
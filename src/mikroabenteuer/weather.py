@@ -75,12 +75,16 @@ def derive_weather_tags(
 
 
 def fetch_weather_for_day(
-    day: date, timezone: str = DEFAULT_TIMEZONE
+    day: date,
+    timezone: str = DEFAULT_TIMEZONE,
+    *,
+    session: Optional[requests.Session] = None,
 ) -> WeatherSummary:
     """
     Fetch daily forecast from Open-Meteo for Düsseldorf.
     No API key required.
 
+    Pass a shared ``session`` to reuse pooled keep-alive connections.
     If the request fails, we return a WeatherSummary with Nones and derived_tags=['Bewölkt'].
     """
     lat, lon = _duesseldorf_coords()
@@ -104,7 +108,7 @@ def fetch_weather_for_day(
     }
 
     try:
-        r = requests.get(url, params=params, timeout=15)
+        r = (session or requests).get(url, params=params, timeout=15)
         r.raise_for_status()
         data = r.json()
 
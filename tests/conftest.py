@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+APP_PATH = Path(__file__).resolve().parents[1] / "app.py"
+
+
+def load_app_module() -> ModuleType:
+    """Execute app.py as a fresh ``app`` module, like a Streamlit rerun does."""
+    app_spec = importlib.util.spec_from_file_location("app", APP_PATH)
+    assert app_spec is not None and app_spec.loader is not None
+    app_module = importlib.util.module_from_spec(app_spec)
+    sys.modules["app"] = app_module
+    app_spec.loader.exec_module(app_module)
+    return app_module
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import json
+import os
 from datetime import date, time
 from pathlib import Path
 
 from mikroabenteuer.activity_library import (
+    _load_activity_library_snapshot,
     load_activity_library,
     suggest_activities_offline,
 )
@@ -122,7 +125,7 @@ def test_offline_selection_returns_substitutions_for_missing_items() -> None:
 
 
 def test_load_activity_library_uses_single_disk_read_per_process(monkeypatch) -> None:
-    load_activity_library.cache_clear()
+    _load_activity_library_snapshot.cache_clear()
     read_count = 0
     original_read_text = Path.read_text
 
@@ -140,4 +143,29 @@ def test_load_activity_library_uses_single_disk_read_per_process(monkeypatch) ->
     assert second
     assert read_count == 1
 
-    load_activity_library.cache_clear()
+    _load_activity_library_snapshot.cache_clear()
+
+
+def test_load_activity_library_reloads_after_file_change(
+    monkeypatch, tmp_path: Path
+) -> None:
+    source = Path("data/activity_library.json").read_text(encoding="utf-8")
+    library_path = tmp_path / "activity_library.json"
+    library_path.write_text(source, encoding="utf-8")
+    monkeypatch.setattr(
+        "mikroabenteuer.activity_library._activity_library_path",
+        lambda: library_path,
+    )
+    _load_activity_library_snapshot.cache_clear()
+
+    first = load_activity_library()
+    assert load_activity_library() is first
+
+    payload = json.loads(source)
+    payload["activities"] = payload["activities"][:1]
+    library_path.write_text(json.dumps(payload), encoding="utf-8")
+    stat = library_path.stat()
+    os.utime(library_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert len(load_activity_library()) == 1
+    _load_activity_library_snapshot.cache_clear()
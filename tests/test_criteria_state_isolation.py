@@ -2,26 +2,17 @@ from __future__ import annotations
 
 from dataclasses import replace
 from datetime import date, time
-import importlib.util
-from pathlib import Path
-import sys
 
 import pytest
+from pydantic import ValidationError
 
 from mikroabenteuer.config import load_config
 from mikroabenteuer.models import DevelopmentDomain
+from mikroabenteuer.ui.state_keys import CRITERIA_WIDGET_FIELDS
+from conftest import load_app_module
 
 
-def _load_app_module():
-    app_spec = importlib.util.spec_from_file_location("app", Path("app.py"))
-    assert app_spec is not None and app_spec.loader is not None
-    app_module = importlib.util.module_from_spec(app_spec)
-    sys.modules["app"] = app_module
-    app_spec.loader.exec_module(app_module)
-    return app_module
-
-
-app = _load_app_module()
+app = load_app_module()
 
 REQUIRED_CORE_FIELDS: set[str] = {
     "plz",
@@ -100,7 +91,7 @@ def test_sync_widget_change_updates_only_target_criteria_key(monkeypatch) -> Non
 def test_master_filter_contract_matches_catalog_and_namespaces(monkeypatch) -> None:
     """Schützt Master-Filtervertrag zwischen Daily und Events."""
     common_catalog_fields = {spec.id for spec in app.CORE_FILTER_SPECS}
-    supported_criteria_fields = set(app.CRITERIA_WIDGET_FIELDS)
+    supported_criteria_fields = set(CRITERIA_WIDGET_FIELDS)
 
     assert REQUIRED_CORE_FIELDS.issubset(common_catalog_fields)
     assert REQUIRED_CORE_FIELDS.issubset(supported_criteria_fields)
@@ -197,3 +188,151 @@ def test_location_preference_mapping_for_events_is_stable(
     mapped = app._normalize_location_preference(raw_values, mode="events")
 
     assert mapped == expected
+
+
+def test_build_criteria_rejects_incomplete_plz_before_model_validation(
+    monkeypatch,
+) -> None:
+    session_state: dict[str, object] = {**_seed_widget_state("sidebar", plz="402")}
+    monkeypatch.setattr(app.st, "session_state", session_state)
+
+    with pytest.raises(ValidationError) as exc_info:
+        app._build_criteria_from_widget_state(namespace="daily")
+
+    errors = exc_info.value.errors()
+    assert [err["loc"] for err in errors] == [("plz",)]
+    assert "5 digits" in errors[0]["msg"]
+
+
+def test_build_criteria_reuses_last_result_for_unchanged_input(monkeypatch) -> None:
+    session_state: dict[str, object] = {**_seed_widget_state("sidebar", plz="40215")}
+    monkeypatch.setattr(app.st, "session_state", session_state)
+
+    first = app._build_criteria_from_widget_state(namespace="daily")
+    second = app._build_criteria_from_widget_state(namespace="daily")
+    session_state["sidebar_plz"] = "50667"
+    third = app._build_criteria_from_widget_state(namespace="daily")
+
+    assert second is first
+    assert third is not first
+    assert third.plz == "50667"
+
+
+def test_pending_daily_sync_skips_rebuild_for_unchanged_values(monkeypatch) -> None:
+    session_state: dict[str, object] = {**_seed_widget_state("sidebar", plz="40215")}
+    monkeypatch.setattr(app.st, "session_state", session_state)
+    app._sync_widget_change_to_criteria(
+        namespace="daily", state_key=app.CRITERIA_DAILY_KEY, raise_on_error=True
+    )
+    calls: list[str] = []
+    monkeypatch.setattr(
+        app,
+        "_build_criteria_from_widget_state",
+        lambda *, namespace: calls.append(namespace),
+    )
+
+    session_state[app.PENDING_DAILY_WIDGET_SYNC_KEY] = {"plz": "40215"}
+    app._apply_pending_daily_widget_sync()
+    assert calls == []
+
+    session_state[app.PENDING_DAILY_WIDGET_SYNC_KEY] = {"plz": "50667"}
+    app._apply_pending_daily_widget_sync()
+    assert calls == ["daily"]
+    assert session_state["sidebar_plz"] == "50667"
+
+
+def test_sanitize_optional_text_drops_symbols_and_collapses_whitespace() -> None:
+    assert (
+        app._sanitize_optional_text("  Kein <Zucker>!\n\t, bitte   Äpfel ")
+        == "Kein Zucker , bitte Äpfel"
+    )
+    assert app._sanitize_optional_text("abc  def", max_chars=4) == "abc"
+    assert app._optional_csv_items("Regen; Jacke, Gummistiefel , Mütze") == [
+        "Regen Jacke",
+        "Gummistiefel",
+    ]
+
+
+def test_time_after_minutes_matches_clock_arithmetic() -> None:
+    assert app._time_after_minutes(time(9, 30), 90) == time(11, 0)
+    assert app._time_after_minutes(time(23, 0), 120) == time(1, 0)
+
+
+def test_build_criteria_rejects_window_past_midnight(monkeypatch) -> None:
+    session_state: dict[str, object] = {**_seed_widget_state("sidebar", plz="40215")}
+    session_state["sidebar_start_time"] = time(23, 0)
+    session_state["sidebar_available_minutes"] = 120
+    monkeypatch.setattr(app.st, "session_state", session_state)
+
+    with pytest.raises(ValidationError):
+        app._build_criteria_from_widget_state(namespace="daily")
+
+
+def test_collect_widget_raw_values_fills_optional_defaults(monkeypatch) -> None:
+    session_state: dict[str, object] = {
+        **_seed_widget_state("sidebar", plz="40215"),
+        **_seed_widget_state("form", plz="50667"),
+        "form_pref_indoor": True,
+    }
+    monkeypatch.setattr(app.st, "session_state", session_state)
+
+    raw_values = app._collect_widget_raw_values("events")
+
+    assert raw_values["plz"] == "50667"
+    assert raw_values["pref_indoor"] is True
+    assert raw_values["pref_outdoor"] is False
+    assert raw_values["extra_context"] == ""
+    assert "pref_indoor" not in app._collect_widget_raw_values("daily")
+
+
+@pytest.mark.parametrize(
+    "age_years",
+    [0.0, 2.5, 3.5, 3.6, 4.5, 5.75, 6.0, 7.0, 8.75, 9.0, 10.5, 14.0],
+)
+def test_nearest_age_band_index_matches_closest_band(age_years: float) -> None:
+    expected = min(app.AGE_BAND_OPTIONS, key=lambda item: abs(item[1] - age_years))[0]
+
+    assert app.AGE_BAND_LABELS[app._nearest_age_band_index(age_years)] == expected
+
+
+def test_filter_formatters_are_shared_per_language() -> None:
+    formatters = app._filter_formatters("EN")
+
+    assert app._filter_formatters("EN") is formatters
+    assert (
+        formatters["goals"](DevelopmentDomain.language)
+        == app.DOMAIN_LABELS[DevelopmentDomain.language]
+    )
+    assert [spec.id for spec in app._core_specs_by_id("plz", "date")] == ["plz", "date"]
+
+
+def test_events_fingerprint_tracks_criteria_mode_and_toggles(monkeypatch) -> None:
+    session_state: dict[str, object] = {}
+    monkeypatch.setattr(app.st, "session_state", session_state)
+    criteria = app._default_criteria(load_config())
+
+    baseline = app._events_fingerprint(criteria, "schnell")
+
+    assert app._events_fingerprint(criteria.model_copy(), "schnell") == baseline
+    assert app._events_fingerprint(criteria, "genau") != baseline
+    session_state["offline_mode"] = True
+    assert app._events_fingerprint(criteria, "schnell") != baseline
+
+
+def test_events_payload_cache_expires_and_is_cleared(monkeypatch) -> None:
+    session_state: dict[str, object] = {}
+    monkeypatch.setattr(app.st, "session_state", session_state)
+    clock = iter([0.0, 10.0, app.EVENTS_PAYLOAD_CACHE_TTL_S + 1.0, 20.0])
+    monkeypatch.setattr(app.time_module, "monotonic", lambda: next(clock))
+    payload = {"events": [], "error_code": None}
+
+    app._store_events_payload("fp", payload)
+    assert app._lookup_events_payload("fp") is payload
+    assert app._lookup_events_payload("fp") is None
+    assert session_state[app.EVENTS_PAYLOAD_CACHE_KEY] == {}
+
+    app._store_events_payload("fp", payload)
+    session_state["events_payload"] = payload
+    app._clear_events_results()
+    assert app.EVENTS_PAYLOAD_CACHE_KEY not in session_state
+    assert "events_payload" not in session_state
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from conftest import load_app_module
+
+app = load_app_module()
+
+
+def test_inject_custom_styles_emits_cached_block_with_static_url(monkeypatch) -> None:
+    emitted: list[str] = []
+    monkeypatch.setattr(
+        app.st, "markdown", lambda body, **_kwargs: emitted.append(body)
+    )
+    background = app.STATIC_DIR / "Hintergrund.png"
+
+    app.inject_custom_styles(background)
+    app.inject_custom_styles(background)
+
+    assert len(emitted) == 2
+    assert emitted[0] is emitted[1]
+    assert "data:image" not in emitted[0]
+    assert "./app/static/Hintergrund.png?v=" in emitted[0]
+    assert "  " not in emitted[0]
+
+
+def test_inject_custom_styles_skips_missing_background(monkeypatch, tmp_path) -> None:
+    emitted: list[str] = []
+    monkeypatch.setattr(
+        app.st, "markdown", lambda body, **_kwargs: emitted.append(body)
+    )
+
+    app.inject_custom_styles(tmp_path / "missing.png")
+
+    assert emitted == []
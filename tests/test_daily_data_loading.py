@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from conftest import load_app_module
+
+from mikroabenteuer import data_seed, recommender
+from mikroabenteuer.config import load_config
+from mikroabenteuer.weather import WeatherSummary
+
+app = load_app_module()
+
+
+def test_load_adventures_and_weather_skips_weather_when_disabled(monkeypatch) -> None:
+    cfg = load_config()
+    weather_calls: list[str] = []
+    monkeypatch.setattr(app, "_load_adventures", lambda: ["a"])
+    monkeypatch.setattr(
+        app, "_get_weather", lambda day, tz: weather_calls.append(day) or "sunny"
+    )
+
+    adventures, weather = app._load_adventures_and_weather(
+        app._default_criteria(cfg), cfg, use_weather=False
+    )
+
+    assert adventures == ["a"]
+    assert weather is None
+    assert weather_calls == []
+
+
+def test_load_adventures_and_weather_fetches_forecast_for_criteria_day(
+    monkeypatch,
+) -> None:
+    cfg = load_config()
+    criteria = app._default_criteria(cfg)
+    monkeypatch.setattr(app, "_load_adventures", lambda: ["a"])
+    monkeypatch.setattr(app, "_get_weather", lambda day, tz: (day, tz))
+
+    adventures, weather = app._load_adventures_and_weather(
+        criteria, cfg, use_weather=True
+    )
+
+    assert adventures == ["a"]
+    assert weather == (criteria.date.isoformat(), cfg.timezone)
+
+
+def test_get_weather_normalizes_timezone_and_routes_past_days(monkeypatch) -> None:
+    calls: list[tuple[str, str, str]] = []
+    monkeypatch.setattr(
+        app,
+        "_get_forecast_weather",
+        lambda day, tz: calls.append(("forecast", day, tz)),
+    )
+    monkeypatch.setattr(
+        app,
+        "_get_past_weather",
+        lambda day, tz: calls.append(("past", day, tz)),
+    )
+
+    app._get_weather("2000-01-01", " Europe/Berlin ")
+    app._get_weather("2999-01-01", "")
+
+    assert calls == [
+        ("past", "2000-01-01", "Europe/Berlin"),
+        ("forecast", "2999-01-01", app.DEFAULT_TIMEZONE),
+    ]
+
+
+def test_get_weather_remembers_failed_fetch_only_briefly(monkeypatch) -> None:
+    fetches: list[date] = []
+
+    def _fake_fetch(day: date, timezone: str, **_kwargs: object) -> WeatherSummary:
+        fetches.append(day)
+        return WeatherSummary(day=day, timezone=timezone)
+
+    clock = iter([100.0, 130.0, 200.0])
+    monkeypatch.setattr(app, "fetch_weather_for_day", _fake_fetch)
+    monkeypatch.setattr(app.time_module, "monotonic", lambda: next(clock))
+    app._get_forecast_weather.clear()
+    app._recent_weather_failures()[0].clear()
+
+    first = app._get_weather("2999-01-01", "Europe/Berlin")
+    second = app._get_weather("2999-01-01", "Europe/Berlin")
+    third = app._get_weather("2999-01-01", "Europe/Berlin")
+
+    assert first.derived_tags == ["Bewölkt"]
+    assert second is first
+    assert third is not first
+    assert fetches == [date(2999, 1, 1), date(2999, 1, 1)]
+    app._recent_weather_failures()[0].clear()
+
+
+def test_recent_weather_failures_are_shared_across_threads(monkeypatch) -> None:
+    def _failing_fetch(day_iso: str, tz: str) -> WeatherSummary:
+        raise app._WeatherUnavailable(WeatherSummary(day=date(2999, 1, 1), timezone=tz))
+
+    monkeypatch.setattr(app, "_get_forecast_weather", _failing_fetch)
+    failures, lock = app._recent_weather_failures()
+    failures.clear()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(
+            pool.map(lambda i: app._get_weather("2999-01-01", f"Zone/{i}"), range(200))
+        )
+
+    assert len(failures) == 200
+    assert app._recent_weather_failures()[1] is lock
+    failures.clear()
+
+
+def test_daily_pick_is_cached_per_criteria_and_weather(monkeypatch) -> None:
+    cfg = load_config()
+    criteria = app._default_criteria(cfg)
+    adventures = app._load_adventures()
+    weather = WeatherSummary(day=criteria.date, timezone=cfg.timezone)
+    calls: list[str] = []
+    real_pick = app.pick_daily_adventure
+
+    def _counting_pick(*args, **kwargs):
+        calls.append("pick")
+        return real_pick(*args, **kwargs)
+
+    monkeypatch.setattr(app, "pick_daily_adventure", _counting_pick)
+    app._daily_pick_slug.clear()
+
+    def _pick(current_weather: WeatherSummary | None) -> str:
+        return app._daily_pick_slug(
+            adventures,
+            criteria,
+            current_weather,
+            cache_key=app._daily_pick_cache_key(criteria, current_weather),
+        )
+
+    first = _pick(weather)
+    assert _pick(weather) == first
+    assert first in {adventure.slug for adventure in adventures}
+    assert calls == ["pick"]
+
+    _pick(None)
+    assert calls == ["pick", "pick"]
+    app._daily_pick_slug.clear()
+
+
+def test_adventure_loaders_survive_script_reruns() -> None:
+    adventures = app._load_adventures()
+    by_slug = app._adventures_by_slug()
+
+    # Streamlit re-executes the script module on every rerun; the resource
+    # caches must outlive it.
+    rerun = load_app_module()
+
+    assert rerun._load_adventures() is adventures
+    assert rerun._adventures_by_slug() is by_slug
+
+
+def test_seed_adventures_are_built_once_across_script_reruns(monkeypatch) -> None:
+    calls: list[int] = []
+    real_seed = data_seed.seed_adventures
+
+    def _counting_seed():
+        calls.append(1)
+        return real_seed()
+
+    # Each rerun re-imports the (patched) name into the fresh script module.
+    monkeypatch.setattr(data_seed, "seed_adventures", _counting_seed)
+    app._load_adventures.clear()
+    try:
+        for _ in range(3):
+            load_app_module()._load_adventures()
+    finally:
+        app._load_adventures.clear()
+        app._adventures_by_slug.clear()
+
+    assert calls == [1]
+
+
+def test_daily_pick_is_stable_and_computed_once_across_reruns(monkeypatch) -> None:
+    cfg = load_config()
+    criteria = app._default_criteria(cfg)
+    weather = WeatherSummary(day=criteria.date, timezone=cfg.timezone)
+    cache_key = app._daily_pick_cache_key(criteria, weather)
+    calls: list[str] = []
+    real_pick = recommender.pick_daily_adventure
+
+    def _counting_pick(*args, **kwargs):
+        calls.append("pick")
+        return real_pick(*args, **kwargs)
+
+    monkeypatch.setattr(recommender, "pick_daily_adventure", _counting_pick)
+    app._daily_pick_slug.clear()
+
+    def _rerun_pick() -> str:
+        rerun = load_app_module()
+        return rerun._daily_pick_slug(
+            rerun._load_adventures(), criteria, weather, cache_key=cache_key
+        )
+
+    try:
+        picks = {_rerun_pick() for _ in range(3)}
+        assert calls == ["pick"]
+        app._daily_pick_slug.clear()
+        # A fresh computation lands on the same adventure.
+        picks.add(_rerun_pick())
+    finally:
+        app._daily_pick_slug.clear()
+
+    assert len(picks) == 1
+    assert calls == ["pick", "pick"]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import date
+
+import orjson
+from conftest import load_app_module
+
+from mikroabenteuer.config import load_config
+from mikroabenteuer.data_seed import seed_adventures
+from mikroabenteuer.weather import WeatherSummary
+
+app = load_app_module()
+
+
+def _weather(tags: list[str]) -> WeatherSummary:
+    return WeatherSummary(
+        day=date(2026, 5, 1),
+        condition="unknown",
+        summary_de_en="Bewölkt / Cloudy",
+        temperature_max_c=None,
+        temperature_min_c=None,
+        precipitation_probability_pct=None,
+        precipitation_sum_mm=None,
+        wind_speed_max_kmh=None,
+        country_code="DE",
+        timezone="Europe/Berlin",
+        data_source="test",
+        derived_tags=tags,
+    )
+
+
+def test_email_preview_cache_key_tracks_adventure_criteria_and_weather() -> None:
+    cfg = load_config()
+    criteria = app._default_criteria(cfg)
+    first, second = seed_adventures()[:2]
+
+    base_key = app._email_preview_cache_key(first, criteria, _weather(["Sonne"]))
+
+    assert base_key == app._email_preview_cache_key(
+        first, criteria, _weather(["Sonne"])
+    )
+    assert base_key != app._email_preview_cache_key(
+        second, criteria, _weather(["Sonne"])
+    )
+    assert base_key != app._email_preview_cache_key(
+        first, criteria, _weather(["Regen"])
+    )
+    assert base_key != app._email_preview_cache_key(
+        first, criteria.model_copy(update={"radius_km": 12.0}), _weather(["Sonne"])
+    )
+
+
+def test_export_json_bytes_emits_declared_dataclass_fields_only() -> None:
+    cfg = load_config()
+    criteria = app._default_criteria(cfg)
+    picked = seed_adventures()[0]
+    picked.transient_note = "not exported"  # type: ignore[attr-defined]
+
+    payload = orjson.loads(
+        app._export_json_bytes(picked, criteria, _weather(["Sonne"]), "# Plan")
+    )
+
+    assert payload["adventure"] == orjson.loads(orjson.dumps(asdict(picked)))
+    assert "transient_note" not in payload["adventure"]
+    assert payload["weather"]["day"] == "2026-05-01"
+    assert payload["weather"]["derived_tags"] == ["Sonne"]
+    assert payload["criteria"]["plz"] == criteria.plz
+    assert payload["markdown"] == "# Plan"
+
+
+def test_export_json_bytes_keeps_umlauts_unescaped() -> None:
+    cfg = load_config()
+    criteria = app._default_criteria(cfg)
+    picked = seed_adventures()[0]
+
+    exported = app._export_json_bytes(
+        picked, criteria, _weather(["Sonne"]), "## Was das fördert"
+    )
+
+    assert "Bewölkt / Cloudy".encode() in exported
+    assert "## Was das fördert".encode() in exported
+    assert b"\\u00f6" not in exported
+    assert orjson.loads(exported)["weather"]["day"] == "2026-05-01"
+
+
+def test_email_code_preview_truncates_long_html_only() -> None:
+    short_html = "<p>kurz</p>"
+    long_html = "x" * (app.EMAIL_CODE_PREVIEW_CHARS + 1)
+
+    assert app._email_code_preview(short_html) == short_html
+    assert (
+        app._email_code_preview(long_html) == "x" * app.EMAIL_CODE_PREVIEW_CHARS + "..."
+    )
+
+
+def test_email_preview_data_url_survives_script_reload() -> None:
+    app._email_preview_data_url.clear()
+    url = app._email_preview_data_url("<p>a</p>", "md", cache_key="k")
+    reloaded = load_app_module()
+
+    # The HTML is not hashed: same key and markdown hit the resource cache.
+    assert reloaded._email_preview_data_url("<p>b</p>", "md", cache_key="k") is url
+    assert url.startswith("data:text/html;base64,")
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import replace
+from types import SimpleNamespace
+from typing import Any
+
+import orjson
+from conftest import load_app_module
+
+from mikroabenteuer.config import load_config
+
+app = load_app_module()
+
+
+def _service(monkeypatch, outcomes: list[str | None]) -> tuple[Any, list[int]]:
+    cfg = replace(
+        load_config(), events_breaker_threshold=2, events_breaker_cooldown_s=60.0
+    )
+    service = app.OpenAIActivityService(cfg=cfg)
+    calls: list[int] = []
+    results = iter(outcomes)
+
+    def _fake_once(*_args: object) -> dict[str, Any]:
+        calls.append(1)
+        return {"suggestions": [], "error_code": next(results)}
+
+    monkeypatch.setattr(service, "_search_events_once", _fake_once)
+    monkeypatch.setattr(app.st, "session_state", {})
+    return service, calls
+
+
+def test_breaker_opens_after_consecutive_upstream_failures(monkeypatch) -> None:
+    service, calls = _service(
+        monkeypatch,
+        [app.ERROR_CODE_RETRYABLE_UPSTREAM, app.ERROR_CODE_API_NON_RETRYABLE],
+    )
+    clock = iter([0.0, 1.0, 2.0, 3.0, 10.0])
+    monkeypatch.setattr(app.time_module, "monotonic", lambda: next(clock))
+    criteria = app._default_criteria(service.cfg)
+
+    service.search_events(criteria, None, "schnell")
+    service.search_events(criteria, None, "schnell")
+    short_circuited = service.search_events(criteria, None, "schnell")
+
+    assert len(calls) == 2
+    assert short_circuited["error_code"] == app.ERROR_CODE_RETRYABLE_UPSTREAM
+    assert short_circuited["suggestions"] == []
+
+
+def test_breaker_closes_after_cooldown_and_resets_on_success(monkeypatch) -> None:
+    service, calls = _service(
+        monkeypatch,
+        [app.ERROR_CODE_RETRYABLE_UPSTREAM, app.ERROR_CODE_RETRYABLE_UPSTREAM, None],
+    )
+    clock = iter([0.0, 1.0, 2.0, 3.0, 100.0])
+    monkeypatch.setattr(app.time_module, "monotonic", lambda: next(clock))
+    criteria = app._default_criteria(service.cfg)
+
+    service.search_events(criteria, None, "schnell")
+    service.search_events(criteria, None, "schnell")
+    result = service.search_events(criteria, None, "schnell")
+
+    assert len(calls) == 3
+    assert result["error_code"] is None
+    assert app.st.session_state[app.EVENTS_BREAKER_KEY].failures == 0
+
+
+def test_activity_orchestrator_is_reused_per_session_config(monkeypatch) -> None:
+    monkeypatch.setattr(app.st, "session_state", {})
+    cfg = load_config()
+
+    first = app._get_activity_orchestrator(cfg)
+
+    assert app._get_activity_orchestrator(replace(cfg)) is first
+    changed = app._get_activity_orchestrator(replace(cfg, events_breaker_threshold=9))
+    assert changed is not first
+    assert changed[0].cfg.events_breaker_threshold == 9
+
+
+def test_orchestrator_overlaps_weather_with_offline_search(monkeypatch) -> None:
+    monkeypatch.setattr(app.st, "session_state", {"offline_mode": True})
+    offline_started = threading.Event()
+    weather = object()
+
+    def _fake_weather(_day_iso: str, _timezone: str) -> Any:
+        assert offline_started.wait(timeout=5.0)
+        return weather
+
+    def _fake_offline(*_args: object, **_kwargs: object) -> tuple[list, list]:
+        offline_started.set()
+        return [], []
+
+    monkeypatch.setattr(app, "_get_weather", _fake_weather)
+    monkeypatch.setattr(app, "suggest_activities_offline", _fake_offline)
+    _service, orchestrator = app._get_activity_orchestrator(load_config())
+
+    payload = orchestrator.run(app._default_criteria(orchestrator.cfg), mode="schnell")
+
+    assert payload["weather"] is weather
+    assert payload["events"] == []
+
+
+def test_unique_preserve_keeps_first_occurrence_across_groups() -> None:
+    assert app._unique_preserve([], ()) == []
+    assert app._unique_preserve(["a", "b", "a"], ["c", "b"], iter(["d", "a"])) == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+
+
+def test_render_events_results_batches_rows_into_single_elements(monkeypatch) -> None:
+    calls: list[tuple[str, str]] = []
+    for name in ("subheader", "write", "info", "markdown", "warning"):
+        monkeypatch.setattr(
+            app.st,
+            name,
+            lambda body, *_args, _name=name, **_kwargs: calls.append((_name, body)),
+        )
+    events = [
+        SimpleNamespace(title="Lesung", reason_de_en="drinnen"),
+        SimpleNamespace(title="Markt", reason_de_en="draußen"),
+    ]
+
+    app.render_events_results(
+        {
+            "warnings": ["w1", "w2"],
+            "events": events,
+            "sources": ["https://a.example", "https://b.example"],
+        },
+        "DE",
+    )
+
+    assert ("warning", "w1\n\nw2") in calls
+    assert ("markdown", "- **Lesung** — drinnen\n- **Markt** — draußen") in calls
+    assert ("markdown", "- https://a.example\n- https://b.example") in calls
+    assert [name for name, _body in calls].count("markdown") == 2
+
+
+def test_events_markdown_uses_fallback_title_for_empty_suggestions() -> None:
+    events = [
+        app.ActivitySuggestion(title="Lesung", reason_de_en="drinnen"),
+        app.ActivitySuggestion(title="", reason_de_en="ohne Titel"),
+    ]
+
+    markdown = app._events_payload_to_markdown({"events": events}, "DE")
+
+    assert "- Lesung: drinnen\n- Vorschlag: ohne Titel\n" in markdown
+
+
+def test_events_json_export_dumps_models_field_wise() -> None:
+    payload = {
+        "weather": None,
+        "warnings": ["Hinweis"],
+        "events": [app.ActivitySuggestion(title="Lesung", reason_de_en="drinnen")],
+        "sources": [],
+        "error_code": None,
+    }
+
+    exported = orjson.loads(app._events_export_json_bytes(payload))
+
+    assert exported["events"][0]["title"] == "Lesung"
+    assert exported["events"][0]["reason_de_en"] == "drinnen"
+    assert exported["warnings"] == ["Hinweis"]
+
+
+def test_event_search_reuses_clean_results_across_calls(monkeypatch) -> None:
+    monkeypatch.setattr(app.st, "session_state", {})
+    app._cached_event_search.clear()
+    calls: list[str] = []
+    outcomes = iter([app.ERROR_CODE_RETRYABLE_UPSTREAM, None, None])
+
+    def _fake_suggest(criteria: Any, **_kwargs: Any) -> SimpleNamespace:
+        calls.append(criteria.plz)
+        return SimpleNamespace(
+            suggestions=[app.ActivitySuggestion(title="Lesung", reason_de_en="ok")],
+            error_code=next(outcomes),
+        )
+
+    monkeypatch.setattr(
+        "mikroabenteuer.openai_activity_service.suggest_activities", _fake_suggest
+    )
+    service = app.OpenAIActivityService(cfg=load_config())
+    criteria = app._default_criteria(service.cfg)
+
+    failed = service.search_events(criteria, None, "schnell")
+    first = service.search_events(criteria, None, "schnell")
+    second = service.search_events(criteria, None, "schnell")
+
+    assert failed["error_code"] == app.ERROR_CODE_RETRYABLE_UPSTREAM
+    assert first["error_code"] is None
+    assert second["suggestions"][0].title == "Lesung"
+    assert len(calls) == 2
+    app._cached_event_search.clear()
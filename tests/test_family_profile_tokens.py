@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from conftest import load_app_module
+
+app = load_app_module()
+
+
+def test_replace_family_tokens_substitutes_all_tokens_in_one_pass() -> None:
+    profile = app.FamilyProfile(
+        child_name="Ida", parent_names="Alex", child_age_years=4.0
+    )
+
+    text = "Carla (2,5) geht mit Miriam los; Miri packt ein."
+
+    assert (
+        app._replace_family_tokens(text, profile)
+        == "Ida (4,0) geht mit Alex los; Alex packt ein."
+    )
+
+
+def test_replace_family_tokens_does_not_rewrite_inserted_names() -> None:
+    profile = app.FamilyProfile(
+        child_name="Mirinda", parent_names="Carla Senior", child_age_years=2.5
+    )
+
+    assert (
+        app._replace_family_tokens("Carla und Miri", profile)
+        == "Mirinda und Carla Senior"
+    )
+
+
+def test_profiled_adventure_cached_matches_uncached_result() -> None:
+    profile = app.FamilyProfile(
+        child_name="Ida", parent_names="Alex", child_age_years=4.0
+    )
+    adventure = app._load_adventures()[0]
+
+    cached = app._profiled_adventure_cached(adventure.slug, profile)
+
+    assert cached == app._profiled_adventure(adventure, profile)
+    assert app._profiled_adventure_cached(adventure.slug, profile) == cached
+
+
+def test_seed_names_profile_is_not_a_no_op_rewrite() -> None:
+    profile = app.FamilyProfile(
+        child_name="Carla", parent_names="Miri", child_age_years=2.5
+    )
+
+    assert app._replace_family_tokens("Carla mit Miriam", profile) == "Carla mit Miri"
+    assert app._family_token_rewriter(profile)("Miriam (2,5)") == "Miri (2,5)"
+
+
+def test_profiled_activity_plan_rewrites_every_field_in_one_batch() -> None:
+    profile = app.FamilyProfile(
+        child_name="Ida", parent_names="Alex", child_age_years=4.0
+    )
+    plan = app.ActivityPlan(
+        title="Carla entdeckt",
+        summary="Mit Miriam (2,5)",
+        steps=["Carla läuft", "Miri hilft"],
+        safety_notes=[],
+        parent_child_prompts=["Frag Carla"],
+        variants=["Drinnen mit Miri"],
+        supports=["Carla"],
+    )
+
+    profiled = app._profiled_activity_plan(plan, profile)
+
+    assert profiled.title == "Ida entdeckt"
+    assert profiled.summary == "Mit Alex (4,0)"
+    assert profiled.steps == ["Ida läuft", "Alex hilft"]
+    assert profiled.safety_notes == []
+    assert profiled.parent_child_prompts == ["Frag Ida"]
+    assert profiled.variants == ["Drinnen mit Alex"]
+    assert profiled.supports == ["Carla"]
+    # A separator inside a field falls back to per-text replacement.
+    assert app._replace_family_tokens_batch(["Carla\x1fMiri", "2,5"], profile) == [
+        "Ida\x1fAlex",
+        "4,0",
+    ]
+
+
+def test_profiled_activity_plan_without_tokens_returns_same_instance() -> None:
+    profile = app.FamilyProfile(
+        child_name="Ida", parent_names="Alex", child_age_years=4.0
+    )
+    plan = app.ActivityPlan(title="Waldrunde", summary="Kurz raus", steps=["Los"])
+
+    assert app._profiled_activity_plan(plan, profile) is plan
@@ -7,9 +7,9 @@ from googleapiclient.errors import HttpError
 from mikroabenteuer.google_api_utils import safe_api_call
 
 
-def _http_error() -> HttpError:
+def _http_error(status: int = 500) -> HttpError:
     return HttpError(
-        resp=SimpleNamespace(status=500, reason="internal error"),
+        resp=SimpleNamespace(status=status, reason="internal error"),
         content=b"error",
         uri="https://example.invalid",
     )
@@ -17,9 +17,9 @@ def _http_error() -> HttpError:
 
 def test_safe_api_call_retries_then_returns(monkeypatch) -> None:
     attempts = {"count": 0}
-    sleeps: list[int] = []
+    sleeps: list[float] = []
 
-    def fake_sleep(value: int) -> None:
+    def fake_sleep(value: float) -> None:
         sleeps.append(value)
 
     def flaky() -> str:
@@ -29,18 +29,21 @@ def test_safe_api_call_retries_then_returns(monkeypatch) -> None:
         return "ok"
 
     monkeypatch.setattr("mikroabenteuer.google_api_utils.time.sleep", fake_sleep)
+    monkeypatch.setattr(
+        "mikroabenteuer.google_api_utils.random.uniform", lambda _low, high: high
+    )
 
     result = safe_api_call(flaky, retries=3)
 
     assert result == "ok"
     assert attempts["count"] == 3
-    assert sleeps == [1, 2]
+    assert sleeps == [1.5, 3.0]
 
 
 def test_safe_api_call_raises_after_max_retries(monkeypatch) -> None:
     attempts = {"count": 0}
 
-    def fake_sleep(_: int) -> None:
+    def fake_sleep(_: float) -> None:
         return None
 
     def always_fail() -> str:
@@ -57,3 +60,24 @@ def test_safe_api_call_raises_after_max_retries(monkeypatch) -> None:
         raise AssertionError("Expected HttpError to be raised")
 
     assert attempts["count"] == 2
+
+
+def test_safe_api_call_does_not_retry_permanent_client_errors(monkeypatch) -> None:
+    attempts = {"count": 0}
+    sleeps: list[float] = []
+
+    def bad_request() -> str:
+        attempts["count"] += 1
+        raise _http_error(status=400)
+
+    monkeypatch.setattr("mikroabenteuer.google_api_utils.time.sleep", sleeps.append)
+
+    try:
+        safe_api_call(bad_request, retries=3)
+    except HttpError:
+        pass
+    else:
+        raise AssertionError("Expected HttpError to be raised")
+
+    assert attempts["count"] == 1
+    assert sleeps == []
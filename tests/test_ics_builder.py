@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, time
 
-from mikroabenteuer.ics import build_ics_event
+from mikroabenteuer.ics import _escape_ics, build_ics_event
 
 
 def test_build_ics_contains_required_fields() -> None:
@@ -19,3 +19,22 @@ def test_build_ics_contains_required_fields() -> None:
     assert "SUMMARY:Wald\\, Spaß" in text
     assert "DESCRIPTION:Zeile 1\\nZeile 2" in text
     assert text.endswith("\r\n")
+
+
+def test_escape_ics_escapes_backslash_once() -> None:
+    assert _escape_ics("a\\b;c,d\ne") == "a\\\\b\\;c\\,d\\ne"
+    assert _escape_ics("\\,") == "\\\\\\,"
+
+
+def test_build_ics_formats_timed_event_across_midnight() -> None:
+    text = build_ics_event(
+        day=date(2026, 12, 31),
+        summary="Sterne",
+        description="",
+        location="",
+        start_time_local=time(23, 50),
+        duration_minutes=30,
+    ).decode("utf-8")
+
+    assert "DTSTART;TZID=Europe/Berlin:20261231T235000\r\n" in text
+    assert "DTEND;TZID=Europe/Berlin:20270101T002000\r\n" in text
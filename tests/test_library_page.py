@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.testing.v1 import AppTest
+
+LIBRARY_PAGE = Path(__file__).resolve().parents[1] / "pages" / "2_Bibliothek.py"
+PAGE_ROWS = 20
+
+
+def test_library_frames_are_built_once_across_reruns(monkeypatch) -> None:
+    # Rendered without the multipage app or an OpenAI key.
+    monkeypatch.setenv("ENABLE_LLM", "false")
+    monkeypatch.setattr(DeltaGenerator, "page_link", lambda *_args, **_kwargs: None)
+    frames: list[int] = []
+    real_from_records = pd.DataFrame.from_records
+
+    def _counting_from_records(*args, **kwargs):
+        frames.append(1)
+        return real_from_records(*args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "from_records", _counting_from_records)
+    st.cache_resource.clear()
+
+    page = AppTest.from_file(str(LIBRARY_PAGE), default_timeout=60)
+    page.run()
+    built = len(frames)
+    page.run()
+    page.run()
+
+    assert not page.exception
+    # Overview table and filter frame; reruns only mask the cached frames.
+    assert built == 2
+    assert len(frames) == built
+
+
+def test_library_selection_is_dropped_when_filters_change(monkeypatch) -> None:
+    monkeypatch.setenv("ENABLE_LLM", "false")
+    monkeypatch.setattr(DeltaGenerator, "page_link", lambda *_args, **_kwargs: None)
+    page = AppTest.from_file(str(LIBRARY_PAGE), default_timeout=60)
+    page.run()
+    table_key = page.dataframe[0].key
+    selected_title = page.dataframe[0].value["title"].iloc[0]
+
+    page.session_state[table_key] = {"selection": {"rows": [0]}}
+    page.run()
+    cards = [m.value for m in page.markdown if m.value.startswith("### ")]
+    assert cards and cards[0].startswith(f"### {selected_title}")
+
+    # The browser keeps sending the selection for the table it rendered.
+    page.session_state[table_key] = {"selection": {"rows": [0]}}
+    page.text_input[0].set_value("Wasser")
+    page.run()
+
+    assert len(page.dataframe[0].value) > 1
+    assert not [m.value for m in page.markdown if m.value.startswith("### ")]
+    assert any("Zeile auswählen" in caption.value for caption in page.caption)
+
+
+def test_library_rows_reset_to_first_page_when_filters_change(monkeypatch) -> None:
+    monkeypatch.setenv("ENABLE_LLM", "false")
+    monkeypatch.setattr(DeltaGenerator, "page_link", lambda *_args, **_kwargs: None)
+    page = AppTest.from_file(str(LIBRARY_PAGE), default_timeout=60)
+    page.run()
+    page.button(key="library_show_more").click()
+    page.run()
+    assert len(page.dataframe[0].value) > PAGE_ROWS
+
+    page.text_input[0].set_value("a")
+    page.run()
+
+    assert page.session_state["library_page_rows"] == PAGE_ROWS
+    assert len(page.dataframe[0].value) <= PAGE_ROWS
@@ -60,3 +60,24 @@ def test_hash_plan_is_stable_for_same_content() -> None:
     plan = _sample_plan()
 
     assert hash_plan(plan) == hash_plan(plan.model_copy())
+
+
+def test_load_plan_reports_reads_lines_written_by_stdlib_json(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    report_path = tmp_path / "reports.jsonl"
+    monkeypatch.setenv("PLAN_REPORTS_PATH", str(report_path))
+    legacy = {"timestamp_utc": "2026-01-01T00:00:00+00:00", "plan_hash": "abc"}
+    report_path.write_text(
+        json.dumps({**legacy, "reason": "Unpassend für Kälte"}, ensure_ascii=False)
+        + "\n",
+        encoding="utf-8",
+    )
+
+    save_plan_report(_sample_plan(), "Sonstiges")
+    reports = load_plan_reports(limit=10)
+
+    assert [report["reason"] for report in reports] == [
+        "Sonstiges",
+        "Unpassend für Kälte",
+    ]
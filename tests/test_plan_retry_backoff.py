@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+from conftest import load_app_module
+
+from mikroabenteuer.config import load_config, offline_config
+from mikroabenteuer.data_seed import seed_adventures
+from mikroabenteuer.models import ActivityPlan
+from mikroabenteuer.openai_gen import ActivityGenerationError
+
+app = load_app_module()
+
+
+@pytest.fixture(autouse=True)
+def _reset_plan_breaker():
+    app._plan_breaker().reset()
+    yield
+
+
+def test_plan_retry_delay_is_capped_and_jittered(monkeypatch) -> None:
+    cfg = load_config()
+    monkeypatch.setattr(app.random, "uniform", lambda low, high: high)
+
+    delays = [app._plan_retry_delay_s(cfg, attempt) for attempt in range(6)]
+
+    assert delays == [0.75, 1.5, 3.0, 6.0, 12.0, 12.0]
+
+
+def test_plan_retry_skips_loop_when_ai_disabled(monkeypatch) -> None:
+    cfg = replace(load_config(), enable_llm=True, openai_api_key="sk-test")
+    calls: list[bool] = []
+    sleeps: list[float] = []
+
+    def _fake_generate(cfg_runtime, *_args, **_kwargs):
+        calls.append(cfg_runtime.enable_llm)
+        raise ActivityGenerationError("should not be retried")
+
+    monkeypatch.setattr(app.st, "session_state", {"use_ai": False})
+    monkeypatch.setattr(app, "generate_activity_plan", _fake_generate)
+    monkeypatch.setattr(app.time_module, "sleep", sleeps.append)
+
+    with pytest.raises(ActivityGenerationError):
+        app._generate_activity_plan_with_retry(
+            cfg,
+            seed_adventures()[0],
+            app._default_criteria(cfg),
+            None,
+            "de",
+            plan_mode="standard",
+        )
+
+    assert calls == [False]
+    assert sleeps == []
+
+
+def test_plan_retry_uses_configured_attempts(monkeypatch) -> None:
+    cfg = replace(
+        load_config(),
+        enable_llm=True,
+        openai_api_key="sk-test",
+        plan_retry_max_attempts=3,
+    )
+    calls: list[bool] = []
+    sleeps: list[float] = []
+    fallback = object()
+
+    def _fake_generate(cfg_runtime, *_args, **_kwargs):
+        calls.append(cfg_runtime.enable_llm)
+        if cfg_runtime.enable_llm:
+            raise ActivityGenerationError("rate limited")
+        return fallback
+
+    monkeypatch.setattr(app.st, "session_state", {"use_ai": True})
+    monkeypatch.setattr(app.st, "error", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(app.st, "caption", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(app, "generate_activity_plan", _fake_generate)
+    monkeypatch.setattr(app.time_module, "sleep", sleeps.append)
+
+    plan: ActivityPlan = app._generate_activity_plan_with_retry(
+        cfg,
+        seed_adventures()[0],
+        app._default_criteria(cfg),
+        None,
+        "de",
+        plan_mode="standard",
+    )
+
+    assert plan is fallback
+    assert calls == [True, True, True, False]
+    assert len(sleeps) == 2
+
+
+def test_plan_breaker_skips_retries_while_open(monkeypatch) -> None:
+    cfg = replace(
+        load_config(),
+        enable_llm=True,
+        openai_api_key="sk-test",
+        plan_breaker_threshold=2,
+        plan_breaker_cooldown_s=30.0,
+    )
+    calls: list[bool] = []
+    sleeps: list[float] = []
+
+    def _fake_generate(cfg_runtime, *_args, **_kwargs):
+        calls.append(cfg_runtime.enable_llm)
+        raise ActivityGenerationError("upstream down")
+
+    monkeypatch.setattr(app, "generate_activity_plan", _fake_generate)
+    monkeypatch.setattr(app.time_module, "sleep", sleeps.append)
+    args = (cfg, seed_adventures()[0], app._default_criteria(cfg), None, "standard")
+
+    with pytest.raises(ActivityGenerationError):
+        app._generate_llm_plan_with_retries(*args)
+    # The second failure opens the breaker: no further attempts, no backoff.
+    assert calls == [True, True]
+    assert len(sleeps) == 1
+
+    with pytest.raises(ActivityGenerationError, match="paused"):
+        app._generate_llm_plan_with_retries(*args)
+    assert calls == [True, True]
+
+    app._plan_breaker().opened_at -= 31.0
+    with pytest.raises(ActivityGenerationError):
+        app._generate_llm_plan_with_retries(*args)
+    assert len(calls) == 3
+
+
+def test_plan_breaker_survives_script_reruns() -> None:
+    cfg = replace(load_config(), plan_breaker_threshold=2)
+    app._record_plan_attempt(ok=False)
+    app._record_plan_attempt(ok=False)
+
+    # Streamlit re-executes the script module on every rerun.
+    rerun = load_app_module()
+
+    assert rerun._plan_breaker() is app._plan_breaker()
+    assert rerun._plan_breaker_open(cfg)
+    rerun._record_plan_attempt(ok=True)
+    assert not app._plan_breaker_open(cfg)
+
+
+def test_plan_retry_reuses_cached_llm_plan_for_identical_inputs(monkeypatch) -> None:
+    cfg = replace(load_config(), enable_llm=True, openai_api_key="sk-test")
+    criteria = app._default_criteria(cfg)
+    adventure = seed_adventures()[0]
+    session_state: dict[str, object] = {"use_ai": True}
+    calls: list[str] = []
+    generated = object()
+
+    def _fake_generate(_cfg_runtime, picked, *_args, **_kwargs):
+        calls.append(picked.slug)
+        return generated
+
+    monkeypatch.setattr(app.st, "session_state", session_state)
+    monkeypatch.setattr(app.st, "caption", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(app, "generate_activity_plan", _fake_generate)
+
+    for _ in range(3):
+        plan = app._generate_activity_plan_with_retry(
+            cfg, adventure, criteria, None, "de", plan_mode="standard"
+        )
+        assert plan is generated
+
+    assert calls == [adventure.slug]
+    assert session_state["request_count"] == 1
+
+
+def test_plan_cache_key_changes_with_family_profile() -> None:
+    cfg = load_config()
+    criteria = app._default_criteria(cfg)
+    adventure = next(a for a in seed_adventures() if "Carla" in a.carla_tip)
+
+    def _key(child_name: str) -> str:
+        profile = app.FamilyProfile(
+            child_name=child_name, parent_names="Alex", child_age_years=4.0
+        )
+        profiled = app._profiled_adventure(adventure, profile)
+        return app._activity_plan_cache_key(cfg, profiled, criteria, None, "standard")
+
+    assert _key("Ida") == _key("Ida")
+    assert _key("Ida") != _key("Noah")
+
+
+def test_offline_config_is_built_once_per_config() -> None:
+    cfg = replace(load_config(), enable_llm=True, openai_api_key="sk-test")
+
+    offline = offline_config(cfg)
+
+    assert offline.enable_llm is False
+    assert offline.openai_model_plan == cfg.openai_model_plan
+    assert offline_config(cfg) is offline
+
+
+def test_superseded_ai_plan_job_is_cancelled(monkeypatch) -> None:
+    cfg = replace(load_config(), enable_llm=True, openai_api_key="sk-test")
+    criteria = app._default_criteria(cfg)
+    adventure = seed_adventures()[0]
+    session_state: dict[str, object] = {"use_ai": True}
+    executor = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    # Occupy the only worker so plan jobs stay queued.
+    executor.submit(release.wait, 5.0)
+
+    monkeypatch.setattr(app.st, "session_state", session_state)
+    monkeypatch.setattr(app, "_plan_executor", lambda: executor)
+    monkeypatch.setattr(app, "generate_activity_plan", lambda *_a, **_k: object())
+
+    try:
+        app._activity_plan_or_pending(
+            cfg, adventure, criteria, None, "de", plan_mode="standard"
+        )
+        _old_key, superseded = session_state[app.PLAN_FUTURE_KEY]
+        app._activity_plan_or_pending(
+            cfg,
+            adventure,
+            criteria.model_copy(update={"radius_km": criteria.radius_km + 1}),
+            None,
+            "de",
+            plan_mode="standard",
+        )
+        _new_key, current = session_state[app.PLAN_FUTURE_KEY]
+
+        assert superseded.cancelled()
+        assert current is not superseded and not current.cancelled()
+    finally:
+        release.set()
+        executor.shutdown(wait=True)
+
+
+def test_ai_plan_runs_in_background_and_shows_placeholder(monkeypatch) -> None:
+    cfg = replace(load_config(), enable_llm=True, openai_api_key="sk-test")
+    criteria = app._default_criteria(cfg)
+    adventure = seed_adventures()[0]
+    session_state: dict[str, object] = {"use_ai": True}
+    release = threading.Event()
+    placeholder, generated = object(), object()
+
+    def _fake_generate(cfg_runtime, *_args, **_kwargs):
+        if not cfg_runtime.enable_llm:
+            return placeholder
+        assert release.wait(timeout=5.0)
+        return generated
+
+    monkeypatch.setattr(app.st, "session_state", session_state)
+    monkeypatch.setattr(app, "generate_activity_plan", _fake_generate)
+
+    first = app._activity_plan_or_pending(
+        cfg, adventure, criteria, None, "de", plan_mode="standard"
+    )
+    assert first == (placeholder, True)
+    assert app._activity_plan_or_pending(
+        cfg, adventure, criteria, None, "de", plan_mode="standard"
+    ) == (placeholder, True)
+
+    release.set()
+    _cache_key, future = session_state[app.PLAN_FUTURE_KEY]
+    future.result(timeout=5.0)
+
+    done = app._activity_plan_or_pending(
+        cfg, adventure, criteria, None, "de", plan_mode="standard"
+    )
+    assert done == (generated, False)
+    assert app.PLAN_FUTURE_KEY not in session_state
+    assert session_state["request_count"] == 1
+    assert app._activity_plan_or_pending(
+        cfg, adventure, criteria, None, "de", plan_mode="standard"
+    ) == (generated, False)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from conftest import load_app_module
+
+app = load_app_module()
+
+
+def test_split_markdown_sections_groups_lines_under_headings() -> None:
+    markdown = """# Titel
+Einleitung wird ignoriert
+## Plan
+- Schritt 1
+- Schritt 2
+## Sicherheit
+Aufpassen.
+## Plan
+- Schritt 3"""
+
+    sections = app._split_markdown_sections(markdown)
+
+    assert sections["plan"] == "- Schritt 1\n- Schritt 2\n- Schritt 3"
+    assert sections["sicherheit"] == "Aufpassen."
+    assert sections["supports"] == ""
+    assert set(sections) == {"plan", "supports", "sicherheit", "impulse", "varianten"}
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from conftest import load_app_module
+
+from mikroabenteuer.config import load_config
+from mikroabenteuer.rate_limit import TokenBucket, credential_bucket_key
+
+
+def test_token_bucket_limits_and_refills(tmp_path: Path) -> None:
+    now = [1000.0]
+    bucket = TokenBucket(
+        tmp_path / "budget.sqlite3",
+        capacity=2,
+        refill_per_s=0.5,
+        clock=lambda: now[0],
+    )
+
+    assert bucket.try_consume("k")
+    assert bucket.try_consume("k")
+    assert not bucket.try_consume("k")
+
+    now[0] += 2.0
+    assert bucket.try_consume("k")
+    assert not bucket.try_consume("k")
+
+
+def test_token_bucket_is_shared_across_instances_and_keyed(tmp_path: Path) -> None:
+    path = tmp_path / "budget.sqlite3"
+    first = TokenBucket(path, capacity=1, refill_per_s=0.0, clock=lambda: 0.0)
+    second = TokenBucket(path, capacity=1, refill_per_s=0.0, clock=lambda: 0.0)
+
+    assert first.try_consume("tab")
+    assert not second.try_consume("tab")
+    assert second.try_consume("other-credential")
+
+
+def test_credential_bucket_key_hashes_the_secret() -> None:
+    key = credential_bucket_key("sk-secret-value")
+
+    assert "sk-secret-value" not in key
+    assert key == credential_bucket_key("sk-secret-value")
+    assert key != credential_bucket_key(None)
+
+
+def test_token_bucket_rejects_invalid_parameters(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(tmp_path / "b.sqlite3", capacity=0, refill_per_s=1.0)
+    with pytest.raises(ValueError):
+        TokenBucket(tmp_path / "b.sqlite3", capacity=1, refill_per_s=-1.0)
+
+
+def test_request_budget_is_shared_across_sessions(tmp_path: Path, monkeypatch) -> None:
+    app = load_app_module()
+    cfg = replace(
+        load_config(),
+        openai_api_key="sk-test",
+        max_requests_per_session=5,
+        shared_budget_path=str(tmp_path / "budget.sqlite3"),
+        shared_budget_capacity=2,
+        shared_budget_refill_per_hour=0.0,
+    )
+    monkeypatch.setattr(app.st, "caption", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(app.st, "warning", lambda *_args, **_kwargs: None)
+
+    first_tab: dict[str, object] = {}
+    monkeypatch.setattr(app.st, "session_state", first_tab)
+    assert app._consume_request_budget(cfg, lang="DE", scope="events-search")
+    assert app._consume_request_budget(cfg, lang="DE", scope="events-search")
+
+    second_tab: dict[str, object] = {}
+    monkeypatch.setattr(app.st, "session_state", second_tab)
+    assert not app._consume_request_budget(cfg, lang="DE", scope="events-search")
+    assert "request_count" not in second_tab
+
+
+def test_request_budget_ignores_unwritable_shared_store(monkeypatch) -> None:
+    app = load_app_module()
+    cfg = replace(
+        load_config(),
+        openai_api_key="sk-test",
+        shared_budget_path="/proc/nope/budget.sqlite3",
+    )
+    monkeypatch.setattr(app.st, "caption", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(app.st, "session_state", {})
+
+    assert app._consume_shared_budget(cfg)
+    assert app._consume_request_budget(cfg, lang="DE", scope="events-search")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from mikroabenteuer import retry as retry_module
+from mikroabenteuer.retry import retry_with_backoff
+
+
+def _fake_time(monkeypatch, ticks: list[float]) -> list[float]:
+    sleeps: list[float] = []
+    clock = iter(ticks)
+    monkeypatch.setattr(
+        retry_module,
+        "time",
+        SimpleNamespace(monotonic=lambda: next(clock), sleep=sleeps.append),
+    )
+    return sleeps
+
+
+def test_retry_stops_when_deadline_would_be_exceeded(monkeypatch) -> None:
+    # start, after slow first failure (9.8s elapsed)
+    sleeps = _fake_time(monkeypatch, [0.0, 9.8])
+    calls: list[int] = []
+
+    @retry_with_backoff(max_attempts=3, base_delay=0.5, deadline_s=10.0)
+    def _flaky() -> str:
+        calls.append(1)
+        raise TimeoutError("timed out")
+
+    with pytest.raises(TimeoutError):
+        _flaky()
+
+    assert calls == [1]
+    assert sleeps == []
+
+
+def test_retry_keeps_fast_failures_within_deadline(monkeypatch) -> None:
+    sleeps = _fake_time(monkeypatch, [0.0, 0.1, 0.7])
+    outcomes = iter([ConnectionError("reset"), ConnectionError("reset"), "ok"])
+
+    @retry_with_backoff(max_attempts=3, base_delay=0.5, deadline_s=10.0)
+    def _flaky() -> str:
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert _flaky() == "ok"
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_rejects_non_positive_deadline() -> None:
+    with pytest.raises(ValueError):
+        retry_with_backoff(max_attempts=2, base_delay=0.1, deadline_s=0)
@@ -69,3 +69,49 @@ def test_openai_model_defaults_can_be_overridden(monkeypatch) -> None:
     assert cfg.openai_model_plan == "gpt-x-plan"
     assert cfg.openai_model_events_fast == "gpt-x-fast"
     assert cfg.openai_model_events_accurate == "gpt-x-accurate"
+
+
+def test_plan_retry_defaults_are_loaded(monkeypatch) -> None:
+    monkeypatch.delenv("PLAN_RETRY_MAX_ATTEMPTS", raising=False)
+    monkeypatch.delenv("PLAN_RETRY_BASE_DELAY_S", raising=False)
+    monkeypatch.delenv("PLAN_RETRY_MAX_DELAY_S", raising=False)
+    monkeypatch.delenv("PLAN_RETRY_JITTER", raising=False)
+
+    cfg = load_config()
+
+    assert cfg.plan_retry_max_attempts == 5
+    assert cfg.plan_retry_base_delay_s == 0.5
+    assert cfg.plan_retry_max_delay_s == 8.0
+    assert cfg.plan_retry_jitter == 0.5
+
+
+def test_events_breaker_defaults_are_loaded(monkeypatch) -> None:
+    monkeypatch.delenv("EVENTS_BREAKER_THRESHOLD", raising=False)
+    monkeypatch.delenv("EVENTS_BREAKER_COOLDOWN_S", raising=False)
+
+    cfg = load_config()
+
+    assert cfg.events_breaker_threshold == 3
+    assert cfg.events_breaker_cooldown_s == 60.0
+
+
+def test_plan_breaker_defaults_are_loaded(monkeypatch) -> None:
+    monkeypatch.delenv("PLAN_BREAKER_THRESHOLD", raising=False)
+    monkeypatch.delenv("PLAN_BREAKER_COOLDOWN_S", raising=False)
+
+    cfg = load_config()
+
+    assert cfg.plan_breaker_threshold == 3
+    assert cfg.plan_breaker_cooldown_s == 30.0
+
+
+def test_shared_budget_is_disabled_by_default(monkeypatch) -> None:
+    monkeypatch.delenv("SHARED_BUDGET_PATH", raising=False)
+    monkeypatch.delenv("SHARED_BUDGET_CAPACITY", raising=False)
+    monkeypatch.delenv("SHARED_BUDGET_REFILL_PER_HOUR", raising=False)
+
+    cfg = load_config()
+
+    assert cfg.shared_budget_path == ""
+    assert cfg.shared_budget_capacity == 10
+    assert cfg.shared_budget_refill_per_hour == 10.0